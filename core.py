@@ -6,18 +6,73 @@
 """
 
 import json
+import mmap
 import os
+import sys
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Protocol, Callable, Tuple
-from dataclasses import dataclass, asdict, field
+from typing import Dict, List, Optional, Any, Protocol, Callable, Tuple, Union
+from dataclasses import dataclass, asdict, field, fields
 from enum import Enum
 from abc import ABC, abstractmethod
-import uuid
 import threading
 import time
 import operator
+import heapq
+import bisect
+from contextlib import contextmanager
 
-from utils import enum_asdict
+try:
+    import orjson
+except ImportError:  # orjson为可选依赖，未安装时回退到标准库json
+    orjson = None
+
+
+def _json_dumps(data: Any) -> bytes:
+    """序列化为UTF-8编码、两空格缩进的JSON"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def _json_loads(raw: Union[bytes, memoryview]) -> Any:
+    """解析UTF-8编码的JSON"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    if isinstance(raw, memoryview):
+        raw = raw.tobytes()
+    return json.loads(raw)
+
+
+def _review_timestamp(next_review: str) -> float:
+    """将下次复习时间转换为时间戳，未设置或无法解析时返回0（视为立即到期）"""
+    if not next_review:
+        return 0.0
+    try:
+        return datetime.fromisoformat(next_review).timestamp()
+    except (ValueError, TypeError):
+        return 0.0
+
+
+def _new_id() -> str:
+    """生成新的单词/笔记id（128位随机数的十六进制表示）"""
+    return os.urandom(16).hex()
+
+
+# 当前时间字符串缓存：[生成时的时间戳, ISO格式字符串]
+_NOW_CACHE: List[Any] = [0.0, ""]
+
+
+def _now_iso() -> str:
+    """返回当前时间的ISO格式字符串
+    
+    结果缓存约0.5秒，批量添加单词、笔记时不必每次都格式化时间；
+    系统时间回拨时立即刷新
+    """
+    t = time.time()
+    if not 0 <= t - _NOW_CACHE[0] < 0.5:
+        _NOW_CACHE[1] = datetime.fromtimestamp(t).isoformat()
+        _NOW_CACHE[0] = t
+    return _NOW_CACHE[1]
 
 
 class WordStatus(Enum):
@@ -34,6 +89,20 @@ class DifficultyLevel(Enum):
     VERY_HARD = 4
 
 
+# Python 3.10+ 的数据类使用__slots__，减少每个实例的内存占用
+_DATACLASS_SLOTS: Dict[str, Any] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# 需要参与复习调度的状态
+_REVIEWABLE_STATUSES = frozenset((WordStatus.LEARNING, WordStatus.REVIEWING))
+
+# 枚举值反查表，加载数据时以字典查找代替Enum构造
+_STATUS_BY_VALUE: Dict[str, WordStatus] = {m.value: m for m in WordStatus}
+_DIFFICULTY_BY_VALUE: Dict[Any, DifficultyLevel] = {
+    **{m.value: m for m in DifficultyLevel},
+    **{str(m.value): m for m in DifficultyLevel}
+}
+
+
 class SortOrder(Enum):
     """排序方式"""
     ALPHABETICAL = "alphabetical"  # 按字母顺序
@@ -44,14 +113,44 @@ class SortOrder(Enum):
     REVIEW_COUNT = "review_count"  # 按复习次数
 
 
-@dataclass
+# 各排序方式对应的排序键
+_SORT_KEYS: Dict[SortOrder, Callable[[Any], Any]] = {
+    SortOrder.ALPHABETICAL: lambda w: w.word.lower(),
+    SortOrder.ADDED_TIME: lambda w: w.learning_data.added_date,
+    SortOrder.REVIEW_TIME: lambda w: w.learning_data.last_reviewed or "1970-01-01",
+    SortOrder.COMPLETENESS: lambda w: w.completeness,
+    SortOrder.STATUS: lambda w: w.status.value,
+    SortOrder.REVIEW_COUNT: lambda w: w.learning_data.review_count,
+}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Note:
     """笔记数据结构"""
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     content: str = ""
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_at: str = field(default_factory=_now_iso)
     tags: List[str] = field(default_factory=list)
     
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为字典格式"""
+        return {
+            'id': self.id,
+            'content': self.content,
+            'created_at': self.created_at,
+            'tags': self.tags
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Note':
+        """从字典创建Note对象"""
+        note = object.__new__(cls)
+        note.id = data.get('id') or _new_id()
+        note.content = data.get('content', "")
+        note.created_at = data.get('created_at') or _now_iso()
+        note.tags = data.get('tags', [])
+        return note
+    
     def get_simplified_display(self, max_length: int = 50) -> str:
         """获取简化显示版本"""
         if len(self.content) <= max_length:
@@ -73,15 +172,32 @@ class Note:
         return result
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class CoreInfo:
     """核心单词信息"""
     pronunciation: str = ""
     primary_definition: str = ""
     part_of_speech: str = ""
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为字典格式"""
+        return {
+            'pronunciation': self.pronunciation,
+            'primary_definition': self.primary_definition,
+            'part_of_speech': self.part_of_speech
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CoreInfo':
+        """从字典创建CoreInfo对象"""
+        info = object.__new__(cls)
+        info.pronunciation = data.get('pronunciation', "")
+        info.primary_definition = data.get('primary_definition', "")
+        info.part_of_speech = data.get('part_of_speech', "")
+        return info
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ExtendedInfo:
     """扩展单词信息"""
     definitions: List[str] = field(default_factory=list)
@@ -90,12 +206,35 @@ class ExtendedInfo:
     antonyms: List[str] = field(default_factory=list)
     etymology: str = ""
     memory_tips: str = ""
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为字典格式"""
+        return {
+            'definitions': self.definitions,
+            'examples': self.examples,
+            'synonyms': self.synonyms,
+            'antonyms': self.antonyms,
+            'etymology': self.etymology,
+            'memory_tips': self.memory_tips
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ExtendedInfo':
+        """从字典创建ExtendedInfo对象"""
+        info = object.__new__(cls)
+        info.definitions = data.get('definitions', [])
+        info.examples = data.get('examples', [])
+        info.synonyms = data.get('synonyms', [])
+        info.antonyms = data.get('antonyms', [])
+        info.etymology = data.get('etymology', "")
+        info.memory_tips = data.get('memory_tips', "")
+        return info
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class LearningData:
     """学习数据"""
-    added_date: str = field(default_factory=lambda: datetime.now().isoformat())
+    added_date: str = field(default_factory=_now_iso)
     source: str = "manual_input"
     context: str = ""
     last_reviewed: str = ""
@@ -103,6 +242,38 @@ class LearningData:
     review_count: int = 0
     correct_count: int = 0
     difficulty: DifficultyLevel = DifficultyLevel.MEDIUM
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为字典格式"""
+        return {
+            'added_date': self.added_date,
+            'source': self.source,
+            'context': self.context,
+            'last_reviewed': self.last_reviewed,
+            'next_review': self.next_review,
+            'review_count': self.review_count,
+            'correct_count': self.correct_count,
+            # 难度可能被直接赋为原始值，只对枚举取value，避免单个字段导致整个文件保存失败
+            'difficulty': self.difficulty.value if isinstance(self.difficulty, Enum) else self.difficulty
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'LearningData':
+        """从字典创建LearningData对象"""
+        difficulty = data.get('difficulty', DifficultyLevel.MEDIUM)
+        if isinstance(difficulty, (str, int)):
+            difficulty = _DIFFICULTY_BY_VALUE[difficulty]
+        
+        learning_data = object.__new__(cls)
+        learning_data.added_date = data.get('added_date') or _now_iso()
+        learning_data.source = data.get('source', "manual_input")
+        learning_data.context = data.get('context', "")
+        learning_data.last_reviewed = data.get('last_reviewed', "")
+        learning_data.next_review = data.get('next_review', "")
+        learning_data.review_count = data.get('review_count', 0)
+        learning_data.correct_count = data.get('correct_count', 0)
+        learning_data.difficulty = difficulty
+        return learning_data
 
 
 @dataclass
@@ -200,27 +371,31 @@ class AppConfig:
         return cls(**data)
     
     def save(self, config_file: str = "config.json"):
-        """保存配置"""
+        """保存配置（写入临时文件后原子替换）"""
+        tmp_file = f"{config_file}.tmp"
         try:
-            with open(config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+            with open(tmp_file, 'wb') as f:
+                f.write(_json_dumps(self.to_dict()))
+            os.replace(tmp_file, config_file)
         except Exception as e:
             print(f"保存配置失败: {e}")
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
     
     @classmethod
     def load(cls, config_file: str = "config.json") -> 'AppConfig':
         """加载配置"""
         if os.path.exists(config_file):
             try:
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                with open(config_file, 'rb') as f:
+                    data = _json_loads(f.read())
                     return cls.from_dict(data)
             except Exception as e:
                 print(f"加载配置失败: {e}")
         return cls()  # 返回默认配置
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Word:
     """单词数据结构"""
     id: str
@@ -233,6 +408,27 @@ class Word:
     extended_info: ExtendedInfo = field(default_factory=ExtendedInfo)
     learning_data: LearningData = field(default_factory=LearningData)
     
+    # 下次复习时间的时间戳缓存，不参与序列化
+    _next_review_ts: float = field(default=0.0, init=False, repr=False, compare=False)
+    # 小写化的搜索文本缓存，不参与序列化
+    _search_blob: str = field(default="", init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.refresh_review_timestamp()
+    
+    def refresh_review_timestamp(self):
+        """根据learning_data.next_review刷新复习时间戳缓存"""
+        self._next_review_ts = _review_timestamp(self.learning_data.next_review)
+    
+    def refresh_search_text(self):
+        """重建搜索用的小写文本（单词、主要释义、标签、笔记），字段间用分隔符隔开避免跨字段匹配"""
+        self._search_blob = "\x1f".join((
+            self.word.lower(),
+            self.core_info.primary_definition.lower(),
+            *(tag.lower() for tag in self.tags),
+            *(note.content.lower() for note in self.notes)
+        ))
+    
     def add_note(self, content: str, tags: List[str] = None) -> Note:
         """添加笔记"""
         note = Note(content=content, tags=tags or [])
@@ -251,26 +447,30 @@ class Word:
             return [note.get_full_display(include_metadata) for note in self.notes]
     
     def calculate_completeness(self) -> float:
-        """计算信息完整度"""
-        score = 0
-        total = 10  # 调整总分以包含笔记
-        
-        # 核心信息权重更高
-        if self.core_info.pronunciation: score += 1.5
-        if self.core_info.primary_definition: score += 2
-        if self.core_info.part_of_speech: score += 1
-        
-        # 扩展信息
-        if self.extended_info.definitions: score += 1.5
-        if self.extended_info.examples: score += 1.5
-        if self.extended_info.synonyms: score += 1
-        if self.extended_info.etymology: score += 0.5
-        if self.extended_info.memory_tips: score += 0.5
-        
-        # 笔记加分
-        if self.notes: score += 0.5
-        
-        self.completeness = min(score / total, 1.0)
+        """计算信息完整度
+        
+        各项按整数权重计分，满分20分
+        """
+        core_info = self.core_info
+        extended_info = self.extended_info
+        
+        score = (
+            # 核心信息权重更高
+            bool(core_info.pronunciation) * 3
+            + bool(core_info.primary_definition) * 4
+            + bool(core_info.part_of_speech) * 2
+            # 扩展信息
+            + bool(extended_info.definitions) * 3
+            + bool(extended_info.examples) * 3
+            + bool(extended_info.synonyms) * 2
+            + bool(extended_info.etymology)
+            + bool(extended_info.memory_tips)
+            # 笔记加分
+            + bool(self.notes)
+        )
+        
+        self.completeness = score / 20 if score < 20 else 1.0
+        self.refresh_search_text()
         return self.completeness
     
     def to_dict(self) -> Dict[str, Any]:
@@ -281,44 +481,45 @@ class Word:
             'status': self.status.value,
             'completeness': self.completeness,
             'tags': self.tags,
-            'notes': [asdict(note) for note in self.notes],
-            'core_info': asdict(self.core_info),
-            'extended_info': asdict(self.extended_info),
-            'learning_data': enum_asdict(asdict(self.learning_data))
+            'notes': [note.to_dict() for note in self.notes],
+            'core_info': self.core_info.to_dict(),
+            'extended_info': self.extended_info.to_dict(),
+            'learning_data': self.learning_data.to_dict()
         }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Word':
-        """从字典创建Word对象"""
-        word = cls(
-            id=data['id'],
-            word=data['word'],
-            status=WordStatus(data.get('status', 'draft')),
-            completeness=data.get('completeness', 0.0),
-            tags=data.get('tags', [])
-        )
-        
-        # 重建笔记
-        if 'notes' in data:
-            word.notes = [Note(**note_data) for note_data in data['notes']]
-        
-        # 重建其他信息
-        if 'core_info' in data:
-            word.core_info = CoreInfo(**data['core_info'])
-        
-        if 'extended_info' in data:
-            word.extended_info = ExtendedInfo(**data['extended_info'])
-        
-        if 'learning_data' in data:
-            ld_data = data['learning_data'].copy()
-            if 'difficulty' in ld_data:
-                if isinstance(ld_data['difficulty'], (str, int)):
-                    ld_data['difficulty'] = DifficultyLevel(int(ld_data['difficulty']))
-            word.learning_data = LearningData(**ld_data)
+        """从字典创建Word对象
         
+        绕过dataclass的__init__逐个字段赋值，避免default_factory生成
+        随后即被覆盖的id和时间戳
+        """
+        word = object.__new__(cls)
+        learning_data = (LearningData.from_dict(data['learning_data'])
+                         if 'learning_data' in data else LearningData())
+        word.id = data['id']
+        word.word = data['word']
+        word.status = _STATUS_BY_VALUE[data.get('status', 'draft')]
+        word.completeness = data.get('completeness', 0.0)
+        word.tags = data.get('tags', [])
+        word.notes = [Note.from_dict(note_data) for note_data in data.get('notes', [])]
+        word.core_info = (CoreInfo.from_dict(data['core_info'])
+                          if 'core_info' in data else CoreInfo())
+        word.extended_info = (ExtendedInfo.from_dict(data['extended_info'])
+                              if 'extended_info' in data else ExtendedInfo())
+        word.learning_data = learning_data
+        word._next_review_ts = _review_timestamp(learning_data.next_review)
+        word.refresh_search_text()
         return word
 
 
+# 各数据类的字段名集合，用于按关键字参数分派更新
+_CORE_FIELDS = frozenset(f.name for f in fields(CoreInfo))
+_EXT_FIELDS = frozenset(f.name for f in fields(ExtendedInfo))
+_LEARN_FIELDS = frozenset(f.name for f in fields(LearningData))
+_WORD_FIELDS = frozenset(f.name for f in fields(Word) if f.init)
+
+
 # 抽象接口定义
 class IVocabularyStorage(ABC):
     """词汇存储接口"""
@@ -347,6 +548,12 @@ class ILearningAlgorithm(ABC):
         """计算下次复习时间"""
         pass
     
+    def calculate_next_reviews(self, words: List[Word],
+                               performances: List[str]) -> List[datetime]:
+        """批量计算下次复习时间，默认逐个调用calculate_next_review"""
+        return [self.calculate_next_review(word, performance)
+                for word, performance in zip(words, performances)]
+    
     @abstractmethod
     def should_promote_status(self, word: Word) -> bool:
         """判断是否应该提升状态"""
@@ -385,29 +592,51 @@ class JSONStorage(IVocabularyStorage):
         words = {}
         if os.path.exists(self.config.data_file):
             try:
-                with open(self.config.data_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    for word_data in data.get('words', []):
-                        word = Word.from_dict(word_data)
-                        words[word.id] = word
+                # 通过内存映射按需读入文件内容，避免额外复制一份完整字节串
+                with open(self.config.data_file, 'rb') as f, \
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                        memoryview(mm) as view:
+                    data = _json_loads(view)
+                for word_data in data.get('words', []):
+                    word = Word.from_dict(word_data)
+                    words[word.id] = word
             except Exception as e:
                 print(f"加载数据失败: {e}")
         return words
     
     def save(self, words: Dict[str, Word]) -> bool:
-        """保存数据"""
+        """保存数据
+        
+        逐个单词流式写入临时文件，再原子替换数据文件，写入中途崩溃不会损坏已有数据
+        """
+        tmp_file = f"{self.config.data_file}.tmp"
         try:
-            data = {
-                'version': '1.1',
-                'created_at': datetime.now().isoformat(),
-                'word_count': len(words),
-                'words': [word.to_dict() for word in words.values()]
-            }
-            with open(self.config.data_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            # 复制一份引用列表，避免自动保存线程迭代时字典被修改
+            word_list = list(words.values())
+            header = (
+                b'{\n  "version": "1.1",\n  "created_at": '
+                + _json_dumps(_now_iso())
+                + b',\n  "word_count": ' + str(len(word_list)).encode()
+                + b',\n  "words": ['
+            )
+            with open(tmp_file, 'wb') as f:
+                # 逐个单词序列化写入，不在内存中构建完整的字典列表；
+                # 输出格式与整体缩进序列化保持一致
+                f.write(header)
+                separator = b'\n    '
+                for word in word_list:
+                    f.write(separator)
+                    f.write(_json_dumps(word.to_dict()).replace(b'\n', b'\n    '))
+                    separator = b',\n    '
+                f.write(b'\n  ]\n}' if word_list else b']\n}')
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.config.data_file)
             return True
         except Exception as e:
             print(f"保存数据失败: {e}")
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
             return False
     
     def backup(self) -> bool:
@@ -432,12 +661,18 @@ class JSONStorage(IVocabularyStorage):
     def _cleanup_old_backups(self):
         """清理旧备份文件"""
         try:
-            import glob
-            backup_pattern = f"{self.config.data_file}.backup.*"
-            backup_files = sorted(glob.glob(backup_pattern), reverse=True)
+            data_dir = os.path.dirname(self.config.data_file) or "."
+            prefix = os.path.basename(self.config.data_file) + ".backup."
             
-            if len(backup_files) > self.config.backup_count:
-                for old_backup in backup_files[self.config.backup_count:]:
+            # 备份文件名以时间戳结尾，按文件名排序即按备份时间排序
+            # （copy2 会保留原文件的 mtime，不能用来判断备份先后）
+            with os.scandir(data_dir) as entries:
+                backups = [entry.path for entry in entries
+                           if entry.name.startswith(prefix)]
+            
+            excess = len(backups) - self.config.backup_count
+            if excess > 0:
+                for old_backup in heapq.nsmallest(excess, backups):
                     os.remove(old_backup)
         except Exception as e:
             print(f"清理备份失败: {e}")
@@ -451,24 +686,41 @@ class SimpleSpacedRepetition(ILearningAlgorithm):
     
     def calculate_next_review(self, word: Word, performance: str) -> datetime:
         """计算下次复习时间"""
-        base_interval = self.config.sr_base_intervals.get(performance, 1.0)
-        
-        # 根据复习次数调整间隔
-        review_multiplier = min(word.learning_data.review_count * 0.3 + 1, 3.0)
+        return self.calculate_next_reviews([word], [performance])[0]
+    
+    def calculate_next_reviews(self, words: List[Word],
+                               performances: List[str]) -> List[datetime]:
+        """批量计算下次复习时间
         
-        # 根据正确率调整
-        if word.learning_data.review_count > 0:
-            accuracy = word.learning_data.correct_count / word.learning_data.review_count
-            accuracy_multiplier = max(0.5, accuracy * 1.5)
-        else:
-            accuracy_multiplier = 1.0
+        配置查找和当前时间只取一次，适合批量导入或重排复习计划
+        """
+        base_intervals = self.config.sr_base_intervals
+        max_interval_days = self.config.max_interval_days
+        now = datetime.now()
+        next_reviews = []
         
-        final_interval = min(
-            base_interval * review_multiplier * accuracy_multiplier,
-            self.config.max_interval_days
-        )
+        for word, performance in zip(words, performances):
+            learning_data = word.learning_data
+            review_count = learning_data.review_count
+            base_interval = base_intervals.get(performance, 1.0)
+            
+            # 根据复习次数调整间隔
+            review_multiplier = min(review_count * 0.3 + 1, 3.0)
+            
+            # 根据正确率调整
+            if review_count > 0:
+                accuracy = learning_data.correct_count / review_count
+                accuracy_multiplier = max(0.5, accuracy * 1.5)
+            else:
+                accuracy_multiplier = 1.0
+            
+            final_interval = min(
+                base_interval * review_multiplier * accuracy_multiplier,
+                max_interval_days
+            )
+            next_reviews.append(now + timedelta(days=final_interval))
         
-        return datetime.now() + timedelta(days=final_interval)
+        return next_reviews
     
     def should_promote_status(self, word: Word) -> bool:
         """判断是否应该提升状态"""
@@ -490,8 +742,33 @@ class VocabularyCore:
         self.algorithm = algorithm or SimpleSpacedRepetition(self.config)
         
         self.words: Dict[str, Word] = {}
-        self._auto_save_timer: Optional[threading.Timer] = None
-        self._data_changed = False
+        
+        # 辅助索引：按状态/标签分组的单词id（dict用作有序集合）和按下次复习时间排序的堆
+        self._by_status: Dict[WordStatus, Dict[str, None]] = {s: {} for s in WordStatus}
+        self._indexed_status: Dict[str, WordStatus] = {}
+        self._by_tag: Dict[str, Dict[str, None]] = {}
+        self._indexed_tags: Dict[str, frozenset] = {}
+        self._review_heap: List[Tuple[float, str]] = []
+        
+        # 单词前缀索引：按(小写单词, id)排序的列表，用于前缀查找
+        self._word_keys: List[Tuple[str, str]] = []
+        self._indexed_word: Dict[str, str] = {}
+        
+        # 数据版本号，任何修改都会递增；排序结果缓存在数据修改时失效
+        self.data_version = 0
+        self._sort_caches: Dict[Tuple[SortOrder, bool], List[str]] = {}
+        # 统计结果缓存：(数据版本, 缓存失效时间戳, 统计结果)
+        self._stats_cache: Optional[Tuple[int, float, Dict[str, Any]]] = None
+        
+        self._auto_save_thread: Optional[threading.Thread] = None
+        self._stop_auto_save = threading.Event()
+        self._dirty = threading.Event()  # 数据是否有未保存的修改
+        
+        # 批量修改状态：推迟完整度计算和修改标记
+        self._batch_depth = 0
+        self._batch_changed = False
+        self._pending_completeness: Dict[str, Word] = {}
+        self._save_lock = threading.Lock()
         
         # 事件回调
         self.on_word_added: Optional[Callable[[Word], None]] = None
@@ -505,41 +782,219 @@ class VocabularyCore:
     def load_data(self):
         """加载数据"""
         self.words = self.storage.load()
-        self._data_changed = False
+        self._rebuild_indexes()
+        self.data_version += 1
+        self._sort_caches.clear()
+        self._dirty.clear()
+    
+    def _mark_changed(self):
+        """标记数据已修改，并使依赖数据的缓存失效"""
+        self.data_version += 1
+        self._sort_caches.clear()
+        if self._batch_depth:
+            self._batch_changed = True
+        else:
+            self._dirty.set()
+    
+    def _update_completeness(self, word: Word):
+        """重新计算单词完整度，批量修改期间推迟到批量结束时统一计算"""
+        if self._batch_depth:
+            self._pending_completeness[word.id] = word
+            word.refresh_search_text()
+        else:
+            word.calculate_completeness()
+    
+    @contextmanager
+    def batch(self):
+        """批量修改上下文
+        
+        期间的修改推迟计算完整度，退出时统一计算并只标记一次数据修改；
+        支持嵌套，以最外层退出为准
+        
+        用法:
+            with core.batch():
+                for word_str in words:
+                    core.add_word(word_str)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                pending_ids = list(self._pending_completeness)
+                self._pending_completeness.clear()
+                self.recompute_completeness(pending_ids)
+                if self._batch_changed:
+                    self._batch_changed = False
+                    self._mark_changed()
+    
+    @contextmanager
+    def deferred_save(self):
+        """批量修改并在结束时保存一次
+        
+        期间的修改与batch相同，不会触发自动保存；退出最外层时若开启了自动保存，
+        立即写盘而不必等待下一个保存间隔
+        """
+        with self.batch():
+            yield self
+        if not self._batch_depth and self.config.auto_save:
+            self.save_data()
+    
+    def recompute_completeness(self, word_ids: List[str]) -> int:
+        """批量重新计算单词完整度，忽略不存在的单词
+        
+        Returns:
+            完整度发生变化的单词数量
+        """
+        words = self.words
+        changed = 0
+        for word_id in word_ids:
+            word = words.get(word_id)
+            if word is None:
+                continue
+            old_completeness = word.completeness
+            if word.calculate_completeness() != old_completeness:
+                changed += 1
+        
+        if changed:
+            self._mark_changed()
+        return changed
+    
+    def _rebuild_indexes(self):
+        """根据当前单词重建全部辅助索引"""
+        self._by_status = {s: {} for s in WordStatus}
+        self._indexed_status = {}
+        self._by_tag = {}
+        self._indexed_tags = {}
+        self._review_heap = []
+        self._indexed_word = {word_id: word.word.lower() for word_id, word in self.words.items()}
+        self._word_keys = sorted((key, word_id) for word_id, key in self._indexed_word.items())
+        for word in self.words.values():
+            self._index_word(word)
+    
+    def _index_word(self, word: Word):
+        """单词新增或状态、标签、复习时间变化后更新索引"""
+        old_status = self._indexed_status.get(word.id)
+        if old_status is not word.status:
+            if old_status is not None:
+                self._by_status[old_status].pop(word.id, None)
+            self._by_status[word.status][word.id] = None
+            self._indexed_status[word.id] = word.status
+        
+        old_tags = self._indexed_tags.get(word.id, frozenset())
+        new_tags = frozenset(word.tags)
+        if old_tags != new_tags:
+            self._remove_tags(word.id, old_tags - new_tags)
+            for tag in new_tags - old_tags:
+                self._by_tag.setdefault(tag, {})[word.id] = None
+            self._indexed_tags[word.id] = new_tags
+        
+        if word.status in _REVIEWABLE_STATUSES:
+            # 旧条目不主动删除，出堆时按状态和时间戳校验后丢弃；过期条目过多时重建
+            if len(self._review_heap) > 2 * len(self.words) + 64:
+                self._review_heap = [
+                    (w._next_review_ts, w.id) for w in self.words.values()
+                    if w.status in _REVIEWABLE_STATUSES
+                ]
+                heapq.heapify(self._review_heap)
+            else:
+                heapq.heappush(self._review_heap, (word._next_review_ts, word.id))
+        
+        old_key = self._indexed_word.get(word.id)
+        new_key = word.word.lower()
+        if old_key != new_key:
+            if old_key is not None:
+                self._remove_word_key(old_key, word.id)
+            bisect.insort(self._word_keys, (new_key, word.id))
+            self._indexed_word[word.id] = new_key
+    
+    def _unindex_word(self, word_id: str):
+        """单词删除后移出索引"""
+        old_status = self._indexed_status.pop(word_id, None)
+        if old_status is not None:
+            self._by_status[old_status].pop(word_id, None)
+        self._remove_tags(word_id, self._indexed_tags.pop(word_id, frozenset()))
+        
+        old_key = self._indexed_word.pop(word_id, None)
+        if old_key is not None:
+            self._remove_word_key(old_key, word_id)
+    
+    def _remove_word_key(self, key: str, word_id: str):
+        """从单词前缀索引中移除一项"""
+        i = bisect.bisect_left(self._word_keys, (key, word_id))
+        if i < len(self._word_keys) and self._word_keys[i] == (key, word_id):
+            del self._word_keys[i]
+    
+    def _remove_tags(self, word_id: str, tags):
+        """从标签索引中移除单词，清理空标签"""
+        for tag in tags:
+            bucket = self._by_tag.get(tag)
+            if bucket is not None:
+                bucket.pop(word_id, None)
+                if not bucket:
+                    del self._by_tag[tag]
     
     def save_data(self, force: bool = False) -> bool:
         """保存数据"""
-        if not force and not self._data_changed:
-            return True
-        
-        success = self.storage.save(self.words)
-        if success:
-            self._data_changed = False
-            if self.on_data_saved:
-                self.on_data_saved()
+        with self._save_lock:
+            if not force and not self._dirty.is_set():
+                return True
+            
+            # 先清除标记，保存期间发生的修改会重新置位，留待下次保存
+            was_dirty = self._dirty.is_set()
+            self._dirty.clear()
+            success = self.storage.save(self.words)
+            if not success and was_dirty:
+                self._dirty.set()
+        
+        if success and self.on_data_saved:
+            self.on_data_saved()
         return success
     
     def add_word(self, word_str: str, **kwargs) -> Word:
         """添加新单词"""
-        word_id = str(uuid.uuid4())
+        return self._add_word(_new_id(), word_str, kwargs)
+    
+    def add_words_batch(self, word_strs: List[str], **kwargs) -> List[Word]:
+        """批量添加单词，所有单词使用相同的可选参数
+        
+        一次性读取全部id所需的随机字节，并在批量上下文中添加
+        """
+        buf = os.urandom(16 * len(word_strs)).hex()
+        words = []
+        with self.batch():
+            for i, word_str in enumerate(word_strs):
+                # 列表参数（如tags）每个单词各复制一份，避免共享同一对象
+                word_kwargs = {key: list(value) if isinstance(value, list) else value
+                               for key, value in kwargs.items()}
+                words.append(self._add_word(buf[i * 32:(i + 1) * 32], word_str, word_kwargs))
+        return words
+    
+    def _add_word(self, word_id: str, word_str: str, kwargs: Dict[str, Any]) -> Word:
+        """使用指定id创建单词并加入词库"""
         word = Word(id=word_id, word=word_str.lower().strip())
         
         # 设置可选参数
         for key, value in kwargs.items():
-            if hasattr(word.core_info, key):
+            if key in _CORE_FIELDS:
                 setattr(word.core_info, key, value)
-            elif hasattr(word.learning_data, key):
+            elif key in _LEARN_FIELDS:
+                if key == 'difficulty':
+                    value = _DIFFICULTY_BY_VALUE.get(value, value)  # 允许传入1-4或"1"-"4"
                 setattr(word.learning_data, key, value)
-            elif hasattr(word, key):
+            elif key in _WORD_FIELDS:
                 setattr(word, key, value)
         
         # 如果有基本定义，状态改为learning
         if word.core_info.primary_definition:
             word.status = WordStatus.LEARNING
         
-        word.calculate_completeness()
+        self._update_completeness(word)
+        word.refresh_review_timestamp()
         self.words[word_id] = word
-        self._data_changed = True
+        self._index_word(word)
+        self._mark_changed()
         
         if self.on_word_added:
             self.on_word_added(word)
@@ -553,23 +1008,79 @@ class VocabularyCore:
             return None
         
         for key, value in kwargs.items():
-            if hasattr(word.core_info, key):
+            if key in _CORE_FIELDS:
                 setattr(word.core_info, key, value)
-            elif hasattr(word.extended_info, key):
+            elif key in _EXT_FIELDS:
                 setattr(word.extended_info, key, value)
-            elif hasattr(word.learning_data, key):
+            elif key in _LEARN_FIELDS:
+                if key == 'difficulty':
+                    value = _DIFFICULTY_BY_VALUE.get(value, value)  # 允许传入1-4或"1"-"4"
                 setattr(word.learning_data, key, value)
-            elif hasattr(word, key):
+            elif key in _WORD_FIELDS:
                 setattr(word, key, value)
         
-        word.calculate_completeness()
-        self._data_changed = True
+        self._update_completeness(word)
+        word.refresh_review_timestamp()
+        self._index_word(word)
+        self._mark_changed()
         
         if self.on_word_updated:
             self.on_word_updated(word)
         
         return word
     
+    def batch_apply(self, word_ids: List[str], tags_add: Optional[List[str]] = None,
+                    status: Optional[WordStatus] = None,
+                    difficulty: Optional[DifficultyLevel] = None) -> int:
+        """批量修改单词的标签、状态和难度
+        
+        所有修改在同一个批量上下文中完成，完整度统一重新计算，只标记一次数据修改
+        
+        Args:
+            word_ids: 要修改的单词id列表
+            tags_add: 要追加的标签（自动去重）
+            status: 新状态
+            difficulty: 新难度
+        
+        Returns:
+            实际发生修改的单词数量
+        """
+        updated = []
+        with self.batch():
+            for word_id in word_ids:
+                word = self.words.get(word_id)
+                if not word:
+                    continue
+                
+                # 跳过没有实际变化的单词
+                changed = False
+                if tags_add:
+                    new_tags = list(dict.fromkeys(word.tags + tags_add))
+                    if new_tags != word.tags:
+                        word.tags = new_tags
+                        changed = True
+                if status is not None and word.status is not status:
+                    word.status = status
+                    changed = True
+                if difficulty is not None and word.learning_data.difficulty is not difficulty:
+                    word.learning_data.difficulty = difficulty
+                    changed = True
+                if not changed:
+                    continue
+                
+                self._update_completeness(word)
+                self._index_word(word)
+                updated.append(word)
+            
+            if updated:
+                self._mark_changed()
+        
+        if self.on_word_updated:
+            for word in updated:
+                self.on_word_updated(word)
+        
+        return len(updated)
+    
     def add_note_to_word(self, word_id: str, content: str, 
                         tags: List[str] = None) -> Optional[Note]:
         """为单词添加笔记"""
@@ -578,8 +1089,8 @@ class VocabularyCore:
             return None
         
         note = word.add_note(content, tags)
-        word.calculate_completeness()
-        self._data_changed = True
+        self._update_completeness(word)
+        self._mark_changed()
         
         if self.on_word_updated:
             self.on_word_updated(word)
@@ -596,14 +1107,7 @@ class VocabularyCore:
             return []
         
         query = query.lower()
-        results = []
-        
-        for word in self.words.values():
-            if (query in word.word.lower() or 
-                query in word.core_info.primary_definition.lower() or
-                any(query in tag.lower() for tag in word.tags) or
-                any(query in note.content.lower() for note in word.notes)):
-                results.append(word)
+        results = [w for w in self.words.values() if query in w._search_blob]
         
         # 按相关度排序（简单实现）
         results.sort(key=lambda w: (
@@ -615,59 +1119,106 @@ class VocabularyCore:
         limit = limit or self.config.search_result_limit
         return results[:limit]
     
+    def find_words_by_prefix(self, prefix: str, limit: int = None) -> List[Word]:
+        """查找以指定前缀开头的单词（不区分大小写，按字母顺序）
+        
+        只匹配单词本身，通过有序索引二分查找，不遍历词库
+        """
+        prefix = prefix.lower().strip()
+        if not prefix:
+            return []
+        
+        keys = self._word_keys
+        results = []
+        for i in range(bisect.bisect_left(keys, (prefix,)), len(keys)):
+            key, word_id = keys[i]
+            if not key.startswith(prefix) or (limit and len(results) >= limit):
+                break
+            results.append(self.words[word_id])
+        return results
+    
     def get_words_by_status(self, status: WordStatus) -> List[Word]:
         """按状态获取单词"""
-        return [w for w in self.words.values() if w.status == status]
+        return [self.words[word_id] for word_id in self._by_status[status]]
     
     def get_words_for_review(self) -> List[Word]:
-        """获取需要复习的单词"""
-        now = datetime.now()
+        """获取需要复习的单词（按到期时间先后排列）"""
+        now_ts = time.time()
+        heap = self._review_heap
         review_words = []
-        
-        for word in self.words.values():
-            if word.status in [WordStatus.LEARNING, WordStatus.REVIEWING]:
-                if not word.learning_data.next_review:
-                    review_words.append(word)
-                else:
-                    try:
-                        next_review = datetime.fromisoformat(word.learning_data.next_review)
-                        if now >= next_review:
-                            review_words.append(word)
-                    except:
-                        review_words.append(word)
+        seen = set()
+        
+        while heap and heap[0][0] <= now_ts:
+            review_ts, word_id = heapq.heappop(heap)
+            if word_id in seen:
+                continue
+            word = self.words.get(word_id)
+            # 丢弃已删除、已不在复习状态或复习时间已变化的过期条目
+            if (word is None or word.status not in _REVIEWABLE_STATUSES
+                    or word._next_review_ts != review_ts):
+                continue
+            seen.add(word_id)
+            review_words.append(word)
+        
+        # 到期单词在复习前仍然到期，放回堆中
+        for word in review_words:
+            heapq.heappush(heap, (word._next_review_ts, word.id))
         
         return review_words
     
     def update_word_after_review(self, word_id: str, performance: str) -> bool:
         """复习后更新单词状态"""
-        word = self.words.get(word_id)
-        if not word:
-            return False
+        return self.update_words_after_review_batch([word_id], [performance]) == 1
+    
+    def update_words_after_review_batch(self, word_ids: List[str],
+                                        performances: List[str]) -> int:
+        """批量复习后更新单词状态
         
-        # 更新学习数据
-        word.learning_data.review_count += 1
-        word.learning_data.last_reviewed = datetime.now().isoformat()
+        复习间隔由算法一次性批量计算，数据修改标记也只设置一次。
+        每个单词在一批中应只出现一次。
         
-        if performance in ['excellent', 'good']:
-            word.learning_data.correct_count += 1
+        Returns:
+            成功更新的单词数量
+        """
+        reviewed = [(self.words[word_id], performance)
+                    for word_id, performance in zip(word_ids, performances)
+                    if word_id in self.words]
+        if not reviewed:
+            return 0
+        
+        # 更新学习数据
+        now_iso = _now_iso()
+        for word, performance in reviewed:
+            word.learning_data.review_count += 1
+            word.learning_data.last_reviewed = now_iso
+            if performance in ['excellent', 'good']:
+                word.learning_data.correct_count += 1
         
         # 计算下次复习时间
-        next_review = self.algorithm.calculate_next_review(word, performance)
-        word.learning_data.next_review = next_review.isoformat()
+        next_reviews = self.algorithm.calculate_next_reviews(
+            [word for word, _ in reviewed], [performance for _, performance in reviewed]
+        )
         
-        # 检查是否应该提升状态
-        if self.algorithm.should_promote_status(word):
-            if word.status == WordStatus.LEARNING:
-                word.status = WordStatus.REVIEWING
-            elif word.status == WordStatus.REVIEWING:
-                word.status = WordStatus.MASTERED
+        for (word, _), next_review in zip(reviewed, next_reviews):
+            word.learning_data.next_review = next_review.isoformat()
+            word._next_review_ts = next_review.timestamp()
+            
+            # 检查是否应该提升状态
+            if self.algorithm.should_promote_status(word):
+                if word.status == WordStatus.LEARNING:
+                    word.status = WordStatus.REVIEWING
+                elif word.status == WordStatus.REVIEWING:
+                    word.status = WordStatus.MASTERED
+            
+            self._index_word(word)
         
-        self._data_changed = True
+        self._mark_changed()
         
         if self.on_word_updated:
-            self.on_word_updated(word)
+            for word, _ in reviewed:
+                self.on_word_updated(word)
         
-        return True
+        return len(reviewed)
     
     def get_all_words_paginated(self, page: int = 1, page_size: int = 20, 
                                sort_by: SortOrder = SortOrder.ALPHABETICAL,
@@ -683,30 +1234,35 @@ class VocabularyCore:
         Returns:
             (单词列表, 总页数, 总数量)
         """
-        words_list = list(self.words.values())
-        
-        # 排序
-        if sort_by == SortOrder.ALPHABETICAL:
-            words_list.sort(key=lambda w: w.word.lower(), reverse=reverse)
-        elif sort_by == SortOrder.ADDED_TIME:
-            words_list.sort(key=lambda w: w.learning_data.added_date, reverse=reverse)
-        elif sort_by == SortOrder.REVIEW_TIME:
-            words_list.sort(key=lambda w: w.learning_data.last_reviewed or "1970-01-01", reverse=reverse)
-        elif sort_by == SortOrder.COMPLETENESS:
-            words_list.sort(key=lambda w: w.completeness, reverse=reverse)
-        elif sort_by == SortOrder.STATUS:
-            words_list.sort(key=lambda w: w.status.value, reverse=reverse)
-        elif sort_by == SortOrder.REVIEW_COUNT:
-            words_list.sort(key=lambda w: w.learning_data.review_count, reverse=reverse)
+        sorted_ids = self.get_sorted_ids(sort_by, reverse)
         
         # 分页
-        total_count = len(words_list)
+        total_count = len(sorted_ids)
         total_pages = (total_count + page_size - 1) // page_size
         
         start_idx = (page - 1) * page_size
         end_idx = start_idx + page_size
         
-        return words_list[start_idx:end_idx], total_pages, total_count
+        words = self.words
+        page_words = [words[word_id] for word_id in sorted_ids[start_idx:end_idx]]
+        return page_words, total_pages, total_count
+    
+    def get_sorted_ids(self, sort_by: SortOrder = SortOrder.ALPHABETICAL,
+                       reverse: bool = False) -> List[str]:
+        """获取按指定方式排序的单词id列表
+        
+        排序结果按(sort_by, reverse)缓存，数据修改后自动失效，翻页时无需重复排序
+        """
+        cache_key = (sort_by, reverse)
+        sorted_ids = self._sort_caches.get(cache_key)
+        if sorted_ids is None:
+            words_list = list(self.words.values())
+            sort_key = _SORT_KEYS.get(sort_by)
+            if sort_key is not None:
+                words_list.sort(key=sort_key, reverse=reverse)
+            sorted_ids = [w.id for w in words_list]
+            self._sort_caches[cache_key] = sorted_ids
+        return sorted_ids
     
     def delete_word(self, word_id: str) -> bool:
         """删除单词"""
@@ -714,7 +1270,8 @@ class VocabularyCore:
             return False
         
         del self.words[word_id]
-        self._data_changed = True
+        self._unindex_word(word_id)
+        self._mark_changed()
         return True
     
     def delete_words_batch(self, word_ids: List[str]) -> Tuple[int, int]:
@@ -726,11 +1283,12 @@ class VocabularyCore:
         success_count = 0
         fail_count = 0
         
-        for word_id in word_ids:
-            if self.delete_word(word_id):
-                success_count += 1
-            else:
-                fail_count += 1
+        with self.batch():
+            for word_id in word_ids:
+                if self.delete_word(word_id):
+                    success_count += 1
+                else:
+                    fail_count += 1
         
         return success_count, fail_count
     
@@ -744,31 +1302,35 @@ class VocabularyCore:
         if 'core_info' in kwargs:
             core_data = kwargs['core_info']
             for key, value in core_data.items():
-                if hasattr(word.core_info, key):
+                if key in _CORE_FIELDS:
                     setattr(word.core_info, key, value)
         
         # 更新扩展信息
         if 'extended_info' in kwargs:
             ext_data = kwargs['extended_info']
             for key, value in ext_data.items():
-                if hasattr(word.extended_info, key):
+                if key in _EXT_FIELDS:
                     setattr(word.extended_info, key, value)
         
         # 更新学习数据
         if 'learning_data' in kwargs:
             learn_data = kwargs['learning_data']
             for key, value in learn_data.items():
-                if hasattr(word.learning_data, key):
+                if key in _LEARN_FIELDS:
+                    if key == 'difficulty':
+                        value = _DIFFICULTY_BY_VALUE.get(value, value)
                     setattr(word.learning_data, key, value)
         
         # 更新其他属性
         for key, value in kwargs.items():
             if key not in ['core_info', 'extended_info', 'learning_data']:
-                if hasattr(word, key):
+                if key in _WORD_FIELDS:
                     setattr(word, key, value)
         
-        word.calculate_completeness()
-        self._data_changed = True
+        self._update_completeness(word)
+        word.refresh_review_timestamp()
+        self._index_word(word)
+        self._mark_changed()
         
         if self.on_word_updated:
             self.on_word_updated(word)
@@ -788,14 +1350,48 @@ class VocabularyCore:
             note_content = f"[{context}] {content}"
         
         note = word.add_note(note_content, tags)
-        word.calculate_completeness()
-        self._data_changed = True
+        self._update_completeness(word)
+        self._mark_changed()
         
         if self.on_word_updated:
             self.on_word_updated(word)
         
         return note
     
+    def add_note_batch(self, word_ids: List[str], content: str,
+                       tags: List[str] = None, context: str = "") -> int:
+        """为多个单词添加相同内容的笔记
+        
+        笔记内容和创建时间只生成一次，每个单词各自持有一份笔记；
+        完整度统一重新计算，只标记一次数据修改
+        
+        Returns:
+            成功添加笔记的单词数量
+        """
+        note_content = f"[{context}] {content}" if context else content
+        tags = tags or []
+        created_at = _now_iso()
+        
+        updated = []
+        with self.batch():
+            for word_id in word_ids:
+                word = self.words.get(word_id)
+                if not word:
+                    continue
+                word.notes.append(Note(id=_new_id(), content=note_content,
+                                       created_at=created_at, tags=list(tags)))
+                self._update_completeness(word)
+                updated.append(word)
+            
+            if updated:
+                self._mark_changed()
+        
+        if self.on_word_updated:
+            for word in updated:
+                self.on_word_updated(word)
+        
+        return len(updated)
+    
     def add_note_during_review(self, word_id: str, content: str, 
                               review_context: str = "复习中") -> Optional[Note]:
         """复习时添加笔记"""
@@ -805,78 +1401,108 @@ class VocabularyCore:
     
     def get_words_by_tag(self, tag: str) -> List[Word]:
         """按标签获取单词"""
-        return [w for w in self.words.values() if tag in w.tags]
+        return [self.words[word_id] for word_id in self._by_tag.get(tag, ())]
     
     def get_all_tags(self) -> List[str]:
         """获取所有标签"""
-        all_tags = set()
-        for word in self.words.values():
-            all_tags.update(word.tags)
-        return sorted(list(all_tags))
+        return sorted(self._by_tag)
     
     def get_statistics(self) -> Dict[str, Any]:
-        """获取学习统计"""
+        """获取学习统计
+        
+        结果按数据版本缓存；待复习数随时间变化，缓存只保留到下一个单词到期为止
+        """
+        now_ts = time.time()
+        cache = self._stats_cache
+        if cache is not None and cache[0] == self.data_version and now_ts < cache[1]:
+            return self._copy_statistics(cache[2])
+        
+        # 状态、标签来自索引，其余统计在一次遍历中同时计算
+        notes_count = 0
+        total_completeness = 0.0
+        words_for_review = 0
+        next_due_ts = float('inf')
+        latest_added = None
+        latest_reviewed = ""
+        for w in self.words.values():
+            notes_count += len(w.notes)
+            total_completeness += w.completeness
+            if w.status in _REVIEWABLE_STATUSES:
+                if w._next_review_ts <= now_ts:
+                    words_for_review += 1
+                elif w._next_review_ts < next_due_ts:
+                    next_due_ts = w._next_review_ts
+            learning_data = w.learning_data
+            if latest_added is None or learning_data.added_date > latest_added:
+                latest_added = learning_data.added_date
+            if learning_data.last_reviewed and learning_data.last_reviewed > latest_reviewed:
+                latest_reviewed = learning_data.last_reviewed
+        
         stats = {
             'total_words': len(self.words),
-            'by_status': {},
-            'avg_completeness': 0,
-            'words_for_review': len(self.get_words_for_review()),
-            'notes_count': sum(len(w.notes) for w in self.words.values()),
-            'last_added': None,
-            'last_reviewed': None,
-            'total_tags': len(self.get_all_tags())
+            'by_status': {status.value: len(self._by_status[status])
+                          for status in WordStatus},
+            'avg_completeness': total_completeness / len(self.words) if self.words else 0,
+            'words_for_review': words_for_review,
+            'notes_count': notes_count,
+            'last_added': latest_added,
+            'last_reviewed': latest_reviewed or None,
+            'total_tags': len(self._by_tag)
         }
         
-        # 状态统计
-        for status in WordStatus:
-            count = len(self.get_words_by_status(status))
-            stats['by_status'][status.value] = count
-        
-        # 平均完整度
-        if self.words:
-            total_completeness = sum(w.completeness for w in self.words.values())
-            stats['avg_completeness'] = total_completeness / len(self.words)
-        
-        # 最近添加和复习
-        words_list = list(self.words.values())
-        if words_list:
-            # 最近添加
-            latest_added = max(words_list, key=lambda w: w.learning_data.added_date)
-            stats['last_added'] = latest_added.learning_data.added_date
-            
-            # 最近复习
-            reviewed_words = [w for w in words_list if w.learning_data.last_reviewed]
-            if reviewed_words:
-                latest_reviewed = max(reviewed_words, 
-                                    key=lambda w: w.learning_data.last_reviewed)
-                stats['last_reviewed'] = latest_reviewed.learning_data.last_reviewed
-        
-        return stats
+        self._stats_cache = (self.data_version, next_due_ts, stats)
+        return self._copy_statistics(stats)
+    
+    @staticmethod
+    def _copy_statistics(stats: Dict[str, Any]) -> Dict[str, Any]:
+        """复制统计结果，调用方修改返回值不会影响缓存"""
+        return dict(stats, by_status=dict(stats['by_status']))
     
     def _start_auto_save(self):
-        """启动自动保存"""
-        if self._auto_save_timer:
-            self._auto_save_timer.cancel()
+        """启动自动保存
         
-        def auto_save():
-            if self._data_changed:
-                self.save_data()
-            self._start_auto_save()  # 重新设置定时器
+        整个会话只使用一个后台线程，重复调用时若线程仍在运行则直接返回；
+        修改后的保存间隔在下一轮等待时生效
+        """
+        if self._auto_save_thread and self._auto_save_thread.is_alive():
+            return
         
-        self._auto_save_timer = threading.Timer(
-            self.config.auto_save_interval, auto_save
+        self._stop_auto_save.clear()
+        self._auto_save_thread = threading.Thread(
+            target=self._auto_save_loop, name="vocab-auto-save", daemon=True
         )
-        self._auto_save_timer.daemon = True
-        self._auto_save_timer.start()
+        self._auto_save_thread.start()
+    
+    def _auto_save_loop(self):
+        """自动保存循环
+        
+        没有修改时阻塞等待，不产生空转唤醒；出现修改后再等待一个保存间隔，
+        把这段时间内的连续修改合并为一次保存。自动保存被关闭后线程退出，
+        重新开启时由 _start_auto_save 再次启动
+        """
+        stop = self._stop_auto_save
+        while not stop.is_set():
+            self._dirty.wait()
+            if stop.wait(self.config.auto_save_interval):
+                break
+            if not self.config.auto_save:
+                break
+            if self._dirty.is_set():
+                self.save_data()
     
     def cleanup(self):
         """清理资源"""
-        if self._auto_save_timer:
-            self._auto_save_timer.cancel()
+        self._stop_auto_save.set()
         
         # 保存未保存的数据
-        if self._data_changed:
+        if self._dirty.is_set():
             self.save_data()
+        
+        # 唤醒仍在等待修改的自动保存线程，使其退出
+        if self._auto_save_thread and self._auto_save_thread.is_alive():
+            self._dirty.set()
+            self._auto_save_thread.join(timeout=1.0)
+            self._dirty.clear()
 
 
 def create_default_core() -> VocabularyCore:
@@ -0,0 +1,229 @@
+"""
+核心辅助索引一致性测试
+
+VocabularyCore 的状态/标签/前缀索引、复习堆和统计缓存都是增量维护的，
+这里在各种修改之后把查询结果与对全部单词的完整遍历逐一比对
+"""
+
+import random
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+import core
+from core import AppConfig, VocabularyCore, WordStatus
+
+
+TAGS = ("a", "b", "c", "d", "e")
+QUERIES = ("a", "pie", "note", "w1", "ZETA", "x")
+PREFIXES = ("w1", "w2", "w10", "W3", "x", "zz")
+PERFORMANCES = ("excellent", "good", "fair", "poor")
+
+
+@pytest.fixture
+def vocab(tmp_path, monkeypatch):
+    """不自动保存、数据写入临时目录的核心实例"""
+    monkeypatch.chdir(tmp_path)
+    config = AppConfig(auto_save=False, backup_enabled=False,
+                       data_file=str(tmp_path / "vocabulary.json"))
+    return VocabularyCore(config)
+
+
+def _due_timestamp(next_review: str) -> float:
+    """独立于核心实现解析复习时间：未设置或无法解析视为立即到期"""
+    try:
+        return datetime.fromisoformat(next_review).timestamp() if next_review else 0.0
+    except ValueError:
+        return 0.0
+
+
+def _scan_review_ids(vocab: VocabularyCore, now_ts: float) -> set:
+    return {
+        w.id for w in vocab.words.values()
+        if w.status in (WordStatus.LEARNING, WordStatus.REVIEWING)
+        and now_ts >= _due_timestamp(w.learning_data.next_review)
+    }
+
+
+def _scan_search_ids(vocab: VocabularyCore, query: str) -> set:
+    query = query.lower()
+    return {
+        w.id for w in vocab.words.values()
+        if query in w.word.lower()
+        or query in w.core_info.primary_definition.lower()
+        or any(query in tag.lower() for tag in w.tags)
+        or any(query in note.content.lower() for note in w.notes)
+    }
+
+
+def assert_indexes_consistent(vocab: VocabularyCore):
+    """所有基于索引的查询结果都应与完整遍历一致"""
+    words = list(vocab.words.values())
+    now_ts = time.time()
+
+    review_ids = [w.id for w in vocab.get_words_for_review()]
+    assert len(review_ids) == len(set(review_ids))
+    assert set(review_ids) == _scan_review_ids(vocab, now_ts)
+    # 再次查询结果不变（到期条目会被放回堆中）
+    assert {w.id for w in vocab.get_words_for_review()} == set(review_ids)
+
+    for status in WordStatus:
+        assert ({w.id for w in vocab.get_words_by_status(status)}
+                == {w.id for w in words if w.status == status})
+
+    for tag in TAGS:
+        assert ({w.id for w in vocab.get_words_by_tag(tag)}
+                == {w.id for w in words if tag in w.tags})
+    assert vocab.get_all_tags() == sorted({tag for w in words for tag in w.tags})
+
+    for query in QUERIES:
+        assert ({w.id for w in vocab.search_words(query, limit=len(words) + 1)}
+                == _scan_search_ids(vocab, query))
+
+    for prefix in PREFIXES:
+        expected = [word_id for key, word_id in sorted((w.word.lower(), w.id) for w in words)
+                    if key.startswith(prefix.lower())]
+        assert [w.id for w in vocab.find_words_by_prefix(prefix)] == expected
+        assert [w.id for w in vocab.find_words_by_prefix(prefix, limit=2)] == expected[:2]
+
+    stats = vocab.get_statistics()
+    assert stats['total_words'] == len(words)
+    assert stats['words_for_review'] == len(_scan_review_ids(vocab, time.time()))
+    assert stats['by_status'] == {s.value: sum(w.status == s for w in words) for s in WordStatus}
+    assert stats['total_tags'] == len({tag for w in words for tag in w.tags})
+
+
+def test_indexes_after_add_update_delete(vocab):
+    """单个单词的添加、修改、改名和删除后索引保持一致"""
+    apple = vocab.add_word("apple", primary_definition="apple pie", tags=["a", "b"])
+    w10 = vocab.add_word("w10", tags=["c"])
+    w2 = vocab.add_word("W2", primary_definition="x")
+    assert_indexes_consistent(vocab)
+
+    vocab.update_word(apple.id, tags=["b", "e"], status=WordStatus.REVIEWING)
+    vocab.update_word(w10.id, word="x10", next_review="2999-01-01T00:00:00")
+    vocab.update_word(w2.id, status=WordStatus.MASTERED)
+    vocab.add_note_to_word(w10.id, "Zeta note")
+    assert_indexes_consistent(vocab)
+
+    vocab.delete_word(apple.id)
+    vocab.update_word(w10.id, next_review="not a date")
+    assert_indexes_consistent(vocab)
+
+
+def test_indexes_after_batch_operations(vocab):
+    """批量添加、批量修改、批量笔记和批量删除后索引保持一致"""
+    words = vocab.add_words_batch([f"w{i}" for i in range(30)],
+                                  primary_definition="def", tags=["a"])
+    ids = [w.id for w in words]
+    assert_indexes_consistent(vocab)
+
+    vocab.batch_apply(ids[:10], tags_add=["b", "a"], status=WordStatus.REVIEWING)
+    vocab.batch_apply(ids[10:20], status=WordStatus.DRAFT)
+    vocab.add_note_batch(ids[5:15], "zeta", tags=["memory"], context="易混词")
+    assert_indexes_consistent(vocab)
+
+    assert vocab.delete_words_batch(ids[::3] + ["missing"]) == (10, 1)
+    assert_indexes_consistent(vocab)
+
+
+def test_indexes_inside_batch_context(vocab):
+    """batch() 上下文中的修改在退出后反映到全部索引，查询在上下文中也保持一致"""
+    first = vocab.add_word("x1", tags=["a"])
+    version = vocab.data_version
+
+    with vocab.batch():
+        added = vocab.add_word("w1", primary_definition="apple pie", tags=["c"])
+        vocab.update_word(first.id, word="zz top", tags=["d"])
+        assert_indexes_consistent(vocab)
+        vocab.delete_word(added.id)
+        vocab.add_note_to_word(first.id, "ZETA")
+
+    assert vocab.data_version > version
+    assert_indexes_consistent(vocab)
+
+
+def test_indexes_after_review(vocab):
+    """复习更新复习时间和状态后，到期列表与统计随之变化"""
+    words = vocab.add_words_batch(["w1", "w2", "w3"], primary_definition="def")
+    for word in words:
+        vocab.update_word(word.id, status=WordStatus.LEARNING)
+    assert {w.id for w in vocab.get_words_for_review()} == {w.id for w in words}
+
+    vocab.update_words_after_review_batch([w.id for w in words[:2]], ["excellent", "poor"])
+    vocab.update_word_after_review(words[2].id, "good")
+    assert_indexes_consistent(vocab)
+    assert vocab.get_words_for_review() == []
+
+
+def test_statistics_cache_expires_when_word_becomes_due(vocab, monkeypatch):
+    """数据未修改时统计结果被缓存，但单词到期后待复习数应立即更新"""
+    word = vocab.add_word("w1", primary_definition="def")
+    tomorrow = datetime.now() + timedelta(days=1)
+    vocab.update_word(word.id, status=WordStatus.LEARNING, next_review=tomorrow.isoformat())
+
+    assert vocab.get_statistics()['words_for_review'] == 0
+    version = vocab.data_version
+
+    later = tomorrow.timestamp() + 1
+    monkeypatch.setattr(core, "time", SimpleNamespace(time=lambda: later))
+    stats = vocab.get_statistics()
+    assert vocab.data_version == version
+    assert stats['words_for_review'] == 1
+    assert [w.id for w in vocab.get_words_for_review()] == [word.id]
+
+
+def test_statistics_result_is_a_copy(vocab):
+    """修改返回的统计结果不影响缓存"""
+    vocab.add_word("w1")
+    stats = vocab.get_statistics()
+    stats['total_words'] = -1
+    stats['by_status']['draft'] = -1
+    assert vocab.get_statistics()['total_words'] == 1
+    assert vocab.get_statistics()['by_status']['draft'] >= 0
+
+
+def test_randomized_operations_match_full_scan(vocab):
+    """随机混合各种修改，定期与完整遍历比对"""
+    rng = random.Random(1)
+    ids = []
+    for step in range(800):
+        op = rng.random()
+        if op < 0.3 or not ids:
+            word = vocab.add_word(f"w{step}", primary_definition=rng.choice(["", "def"]),
+                                  tags=rng.sample(TAGS[:4], rng.randint(0, 2)))
+            ids.append(word.id)
+        elif op < 0.4:
+            word_id = rng.choice(ids)
+            vocab.delete_word(word_id)
+            ids.remove(word_id)
+        elif op < 0.55:
+            vocab.update_word_after_review(rng.choice(ids), rng.choice(PERFORMANCES))
+        elif op < 0.7:
+            vocab.update_word(rng.choice(ids), status=rng.choice(list(WordStatus)),
+                              next_review=rng.choice(["", "2000-01-01T00:00:00",
+                                                      "2999-01-01T00:00:00", "bad"]))
+        elif op < 0.8:
+            vocab.update_word(rng.choice(ids), tags=rng.sample(TAGS, rng.randint(0, 3)),
+                              primary_definition=rng.choice(["x", "apple pie", ""]))
+        elif op < 0.85:
+            vocab.update_word(rng.choice(ids), word=rng.choice(["x1", "X2", "w1"]))
+        elif op < 0.9:
+            vocab.batch_apply(rng.sample(ids, min(5, len(ids))), tags_add=["e"],
+                              status=rng.choice(list(WordStatus)))
+        elif op < 0.95:
+            with vocab.batch():
+                target = rng.choice(ids)
+                vocab.add_note_to_word(target, rng.choice(["Note A", "zeta"]))
+                vocab.update_word(target, tags=["d"])
+        else:
+            doomed = rng.sample(ids, min(3, len(ids)))
+            vocab.delete_words_batch(doomed)
+            ids = [word_id for word_id in ids if word_id not in doomed]
+
+        if step % 25 == 0:
+            assert_indexes_consistent(vocab)
+
+    assert_indexes_consistent(vocab)
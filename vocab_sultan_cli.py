@@ -7,9 +7,13 @@
 
 import sys
 import os
-from typing import List, Optional, Any, Dict
+import json
+import shlex
+import subprocess
+import tempfile
+from typing import List, Optional, Any, Dict, Tuple
 from datetime import datetime
-import time
+from itertools import islice
 
 # 添加核心模块路径
 sys.path.append(os.path.dirname(__file__))
@@ -28,6 +32,7 @@ try:
     from rich.live import Live
     from rich.rule import Rule
     from rich.markdown import Markdown
+    from rich.markup import escape
     from rich import box
     import rich.traceback
 except ImportError:
@@ -36,13 +41,96 @@ except ImportError:
 
 # 导入核心模块
 from core import (
-    VocabularyCore, Word, WordStatus, AppConfig, 
+    VocabularyCore, Word, WordStatus, DifficultyLevel, AppConfig, 
     create_default_core, Note, SortOrder, AddWordConfig, UIChoiceDefaults
 )
 
 # 启用Rich的异常追踪
 rich.traceback.install()
 
+def _parse_tags(text: str) -> List[str]:
+    """解析逗号分隔的标签输入，去掉空白项；空输入直接返回空列表"""
+    text = text.strip()
+    if not text:
+        return []
+    return [tag for tag in (part.strip() for part in text.split(',')) if tag]
+
+
+# 状态图标和颜色映射
+_STATUS_ICONS = {
+    WordStatus.DRAFT: "📝",
+    WordStatus.LEARNING: "📚", 
+    WordStatus.REVIEWING: "🔄",
+    WordStatus.MASTERED: "✅"
+}
+
+_STATUS_COLORS = {
+    WordStatus.DRAFT: "dim",
+    WordStatus.LEARNING: "yellow",
+    WordStatus.REVIEWING: "blue", 
+    WordStatus.MASTERED: "green"
+}
+
+# 预先生成的状态标记：带颜色的图标，以及带颜色的“图标 状态名”
+_STATUS_MARKUP = {
+    status: f"[{_STATUS_COLORS[status]}]{_STATUS_ICONS[status]}[/{_STATUS_COLORS[status]}]"
+    for status in WordStatus
+}
+
+_STATUS_LABELS = {
+    status: f"[{_STATUS_COLORS[status]}]{_STATUS_ICONS[status]} {status.value}[/{_STATUS_COLORS[status]}]"
+    for status in WordStatus
+}
+
+# 编号菜单选项（编号即列表位置+1）
+_SORT_OPTIONS = (
+    ("按字母顺序", SortOrder.ALPHABETICAL),
+    ("按添加时间", SortOrder.ADDED_TIME),
+    ("按复习时间", SortOrder.REVIEW_TIME),
+    ("按完整度", SortOrder.COMPLETENESS),
+    ("按状态", SortOrder.STATUS),
+    ("按复习次数", SortOrder.REVIEW_COUNT),
+)
+
+_BATCH_EDIT_OPTIONS = ("添加标签", "修改状态", "添加笔记", "修改难度")
+
+_STATUS_OPTIONS = (
+    ("草稿", WordStatus.DRAFT),
+    ("学习中", WordStatus.LEARNING),
+    ("复习中", WordStatus.REVIEWING),
+    ("已掌握", WordStatus.MASTERED),
+)
+
+_DIFFICULTY_OPTIONS = (
+    ("简单", DifficultyLevel.EASY),
+    ("中等", DifficultyLevel.MEDIUM),
+    ("困难", DifficultyLevel.HARD),
+    ("非常困难", DifficultyLevel.VERY_HARD),
+)
+
+# 复习总结表格的行标题
+_SUMMARY_ROWS = ("计划复习", "实际复习", "掌握良好", "正确率")
+
+# (名称, 标签, 上下文)，最后一项为自定义笔记
+_QUICK_NOTE_OPTIONS = (
+    ("记忆技巧", ["memory", "tip"], "记忆技巧"),
+    ("易混词", ["confusion", "similar"], "易混词"),
+    ("使用场景", ["usage", "context"], "使用场景"),
+    ("个人理解", ["understanding", "personal"], "个人理解"),
+    ("自定义", None, "复习笔记"),
+)
+
+# 编辑器中可修改的UI默认值及其合法取值，布尔项另行校验
+_UI_DEFAULT_CHOICES = {
+    "main_menu_default": "123456789",
+    "review_performance_default": "egfp",
+    "vocabulary_sort_default": "123456",
+    "batch_edit_default": "1234",
+    "note_type_default": "12345",
+}
+_UI_DEFAULT_FLAGS = ("confirm_continue_review", "confirm_add_note",
+                     "confirm_batch_edit", "confirm_delete")
+
 
 class RichCliUI:
     """Rich CLI用户界面"""
@@ -51,20 +139,12 @@ class RichCliUI:
         self.console = Console()
         self.core = create_default_core()
         
-        # 状态图标映射
-        self.status_icons = {
-            WordStatus.DRAFT: "📝",
-            WordStatus.LEARNING: "📚", 
-            WordStatus.REVIEWING: "🔄",
-            WordStatus.MASTERED: "✅"
-        }
+        # 主菜单面板缓存：(待复习数, 面板)
+        self._menu_panel: Optional[Tuple[int, Panel]] = None
         
-        self.status_colors = {
-            WordStatus.DRAFT: "dim",
-            WordStatus.LEARNING: "yellow",
-            WordStatus.REVIEWING: "blue", 
-            WordStatus.MASTERED: "green"
-        }
+        # 搜索结果缓存，词库数据版本变化时整体失效
+        self._search_cache: Dict[tuple, List[Word]] = {}
+        self._search_cache_version = -1
         
         # 设置回调
         self.core.on_word_added = self._on_word_added
@@ -83,6 +163,36 @@ class RichCliUI:
         """数据保存回调"""
         self.console.print("💾 数据已自动保存", style="dim")
     
+    def _ask_index(self, prompt: str, count: int, default: str) -> int:
+        """询问编号选项，返回1到count之间的整数，超出范围时重新询问"""
+        try:
+            default_index = int(default)
+        except (TypeError, ValueError):
+            default_index = 1
+        if not 1 <= default_index <= count:
+            default_index = 1
+        
+        while True:
+            choice = IntPrompt.ask(f"{prompt} (1-{count})", default=default_index)
+            if 1 <= choice <= count:
+                return choice
+            self.console.print(f"[prompt.invalid]请输入 1-{count} 之间的数字")
+    
+    def _cached_search(self, query: str) -> List[Word]:
+        """带缓存的单词搜索，重复查询同一关键词时不再遍历词库"""
+        if self._search_cache_version != self.core.data_version:
+            self._search_cache.clear()
+            self._search_cache_version = self.core.data_version
+        
+        key = (query.lower(), self.core.config.search_result_limit)
+        results = self._search_cache.get(key)
+        if results is None:
+            results = self.core.search_words(query)
+            if len(self._search_cache) >= 256:
+                self._search_cache.pop(next(iter(self._search_cache)))
+            self._search_cache[key] = results
+        return results
+    
     def display_header(self):
         """显示标题"""
         title = Text("Vocab Sultan Rich CLI", style="bold magenta")
@@ -95,15 +205,13 @@ class RichCliUI:
         )
         self.console.print(panel)
     
-    def display_main_menu(self):
-        """显示主菜单"""
-        stats = self.core.get_statistics()
-        
+    def _build_menu_panel(self, review_count: int) -> Panel:
+        """构建主菜单面板"""
         # 创建菜单选项
         menu_items = [
             ("1", "📝", "添加单词", "添加新单词到词汇库"),
             ("2", "📚", "批量添加", "连续添加多个单词"),
-            ("3", "🧠", "开始复习", f"复习 {stats['words_for_review']} 个单词"),
+            ("3", "🧠", "开始复习", f"复习 {review_count} 个单词"),
             ("4", "🔍", "搜索单词", "查找和浏览单词"),
             ("5", "📊", "学习统计", "查看详细学习报告"),
             ("6", "💾", "数据管理", "保存、备份和导入数据"),
@@ -120,13 +228,24 @@ class RichCliUI:
         for option, icon, title, desc in menu_items:
             table.add_row(option, f"{icon} {title}", desc)
         
+        return Panel(table, title="主菜单", border_style="blue")
+    
+    def display_main_menu(self):
+        """显示主菜单"""
+        stats = self.core.get_statistics()
+        
+        # 菜单只有待复习数会变化，数量不变时复用上次构建的面板
+        review_count = stats['words_for_review']
+        if self._menu_panel is None or self._menu_panel[0] != review_count:
+            self._menu_panel = (review_count, self._build_menu_panel(review_count))
+        
         # 显示状态栏
         status_text = (f"📚 总词数: {stats['total_words']} | "
-                      f"⏰ 待复习: {stats['words_for_review']} | "
+                      f"⏰ 待复习: {review_count} | "
                       f"📈 平均完整度: {stats['avg_completeness']:.1%}")
         
         self.console.print()
-        self.console.print(Panel(table, title="主菜单", border_style="blue"))
+        self.console.print(self._menu_panel[1])
         self.console.print(Panel(status_text, style="dim"))
     
     def quick_add_word(self):
@@ -141,11 +260,11 @@ class RichCliUI:
             if not word.strip():
                 continue
             
-            # 检查是否已存在
-            existing = self.core.search_words(word)
+            # 检查是否已存在（只按单词前缀匹配）
+            existing = self.core.find_words_by_prefix(word, limit=3)
             if existing:
                 self.console.print(f"⚠️  发现相似单词:")
-                self.display_word_brief_list(existing[:3])
+                self.display_word_brief_list(existing)
                 
                 if not Confirm.ask("继续添加吗?", default=False):
                     continue
@@ -172,29 +291,18 @@ class RichCliUI:
             tags = config.default_tags.copy() if config.default_tags else []
             if not config.skip_tags:
                 tags_input = Prompt.ask("🏷️  标签 (逗号分隔，可选)", default="")
-                if tags_input.strip():
-                    tags.extend([t.strip() for t in tags_input.split(',') if t.strip()])
-            tags = list(set(tags))  # 去重
+                tags.extend(_parse_tags(tags_input))
+            tags = list(dict.fromkeys(tags))  # 去重并保持顺序
             
             # 添加单词
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=self.console
-            ) as progress:
-                task = progress.add_task("正在添加单词...", total=None)
-                
-                word_obj = self.core.add_word(
-                    word,
-                    primary_definition=definition,
-                    pronunciation=pronunciation,
-                    part_of_speech=part_of_speech,
-                    context=context,
-                    tags=tags
-                )
-                
-                time.sleep(0.5)  # 视觉效果
-                progress.update(task, completed=True)
+            word_obj = self.core.add_word(
+                word,
+                primary_definition=definition,
+                pronunciation=pronunciation,
+                part_of_speech=part_of_speech,
+                context=context,
+                tags=tags
+            )
             
             # 显示添加结果
             self.display_word_detail(word_obj)
@@ -214,6 +322,7 @@ class RichCliUI:
         count = 0
         words_added = []
         
+        # 每个单词单独添加，会话期间照常由自动保存落盘，中途退出不会丢失已输入的单词
         while True:
             word = Prompt.ask(f"单词 #{count + 1}", default="")
             
@@ -248,11 +357,10 @@ class RichCliUI:
                 tags = config.default_tags.copy() if config.default_tags else []
                 if not config.skip_tags:
                     tags_input = Prompt.ask("标签 (可选)", default="")
-                    if tags_input.strip():
-                        tags.extend([t.strip() for t in tags_input.split(',') if t.strip()])
+                    tags.extend(_parse_tags(tags_input))
                 
                 if tags:
-                    add_kwargs["tags"] = list(set(tags))  # 去重
+                    add_kwargs["tags"] = list(dict.fromkeys(tags))  # 去重并保持顺序
                 
                 word_obj = self.core.add_word(word, **add_kwargs)
                 words_added.append(word_obj)
@@ -277,22 +385,13 @@ class RichCliUI:
         self.console.print(Rule("[bold]词汇表管理[/bold]"))
         
         # 排序选项
-        sort_options = [
-            ("1", "按字母顺序", SortOrder.ALPHABETICAL),
-            ("2", "按添加时间", SortOrder.ADDED_TIME),
-            ("3", "按复习时间", SortOrder.REVIEW_TIME),
-            ("4", "按完整度", SortOrder.COMPLETENESS),
-            ("5", "按状态", SortOrder.STATUS),
-            ("6", "按复习次数", SortOrder.REVIEW_COUNT),
-        ]
-        
         self.console.print("选择排序方式:")
-        for key, desc, _ in sort_options:
+        for key, (desc, _) in enumerate(_SORT_OPTIONS, 1):
             self.console.print(f"  {key}. {desc}")
         
-        sort_choice = Prompt.ask("选择排序方式", choices=[s[0] for s in sort_options], 
-                                default=self.core.config.ui_defaults.vocabulary_sort_default)
-        sort_by = sort_options[int(sort_choice) - 1][2]
+        sort_choice = self._ask_index("选择排序方式", len(_SORT_OPTIONS),
+                                      self.core.config.ui_defaults.vocabulary_sort_default)
+        sort_by = _SORT_OPTIONS[sort_choice - 1][1]
         
         # 是否逆序
         reverse = Confirm.ask("逆序排列?", default=False)
@@ -308,6 +407,12 @@ class RichCliUI:
             words, total_pages, total_count = self.core.get_all_words_paginated(
                 page=page, page_size=page_size, sort_by=sort_by, reverse=reverse
             )
+            # 批量删除后总页数可能减少，回到最后一页重新获取
+            if page > total_pages > 0:
+                page = total_pages
+                words, total_pages, total_count = self.core.get_all_words_paginated(
+                    page=page, page_size=page_size, sort_by=sort_by, reverse=reverse
+                )
             
             self.console.clear()
             self.console.print(Rule(f"[bold]词汇表 - 第 {page}/{total_pages} 页 (共 {total_count} 个单词)[/bold]"))
@@ -363,30 +468,28 @@ class RichCliUI:
     
     def display_word_list_with_actions(self, words: List[Word], show_index: bool = False):
         """显示带操作选项的单词列表"""
+        markup = _STATUS_MARKUP
+        
         table = Table(box=box.MINIMAL)
         if show_index:
-            table.add_column("#", width=3)
+            table.add_column("#", width=3, no_wrap=True)
         table.add_column("单词", style="bold")
-        table.add_column("状态", width=8)
+        table.add_column("状态", width=8, no_wrap=True)
         table.add_column("释义", width=40)
-        table.add_column("完整度", width=8)
-        table.add_column("复习次数", width=8)
+        table.add_column("完整度", width=8, no_wrap=True)
+        table.add_column("复习次数", width=8, no_wrap=True)
         
         for i, word in enumerate(words, 1):
-            icon = self.status_icons.get(word.status, "?")
-            status_color = self.status_colors.get(word.status, "white")
-            
-            row_data = []
-            if show_index:
-                row_data.append(str(i))
+            definition = word.core_info.primary_definition
+            short_definition = definition if len(definition) <= 40 else f"{definition[:40]}..."
             
-            row_data.extend([
+            row_data = ((str(i),) if show_index else ()) + (
                 word.word,
-                f"[{status_color}]{icon}[/{status_color}]",
-                word.core_info.primary_definition[:40] + "..." if len(word.core_info.primary_definition) > 40 else word.core_info.primary_definition,
+                markup[word.status],
+                short_definition,
                 f"{word.completeness:.0%}",
                 str(word.learning_data.review_count)
-            ])
+            )
             
             table.add_row(*row_data)
         
@@ -394,16 +497,14 @@ class RichCliUI:
     
     def select_word_from_list(self, words: List[Word]):
         """从列表中选择单词进行详细操作"""
-        try:
-            choice = IntPrompt.ask(
-                f"选择单词 (1-{len(words)}，0返回)",
-                default=0
-            )
-            if 1 <= choice <= len(words):
-                selected_word = words[choice - 1]
-                self.show_word_detail_menu(selected_word)
-        except:
-            pass
+        # IntPrompt 会自行重新询问非数字输入
+        choice = IntPrompt.ask(
+            f"选择单词 (1-{len(words)}，0返回)",
+            default=0
+        )
+        if 1 <= choice <= len(words):
+            selected_word = words[choice - 1]
+            self.show_word_detail_menu(selected_word)
     
     def batch_edit_words(self, words: List[Word]):
         """批量编辑单词"""
@@ -434,70 +535,52 @@ class RichCliUI:
     def batch_edit_selected_words(self, words: List[Word]):
         """批量编辑选中的单词"""
         self.console.print("选择要批量修改的属性:")
-        edit_options = [
-            ("1", "添加标签"),
-            ("2", "修改状态"),
-            ("3", "添加笔记"),
-            ("4", "修改难度"),
-        ]
-        
-        for key, desc in edit_options:
+        for key, desc in enumerate(_BATCH_EDIT_OPTIONS, 1):
             self.console.print(f"  {key}. {desc}")
         
-        choice = Prompt.ask("选择操作", choices=[o[0] for o in edit_options], 
-                           default=self.core.config.ui_defaults.batch_edit_default)
+        choice = self._ask_index("选择操作", len(_BATCH_EDIT_OPTIONS),
+                                 self.core.config.ui_defaults.batch_edit_default)
         
-        if choice == "1":
+        if choice == 1:
             self.batch_add_tags(words)
-        elif choice == "2":
+        elif choice == 2:
             self.batch_change_status(words)
-        elif choice == "3":
+        elif choice == 3:
             self.batch_add_notes(words)
-        elif choice == "4":
+        elif choice == 4:
             self.batch_change_difficulty(words)
     
     def batch_add_tags(self, words: List[Word]):
         """批量添加标签"""
         tags_input = Prompt.ask("要添加的标签 (逗号分隔)")
-        tags = [t.strip() for t in tags_input.split(',') if t.strip()]
+        tags = _parse_tags(tags_input)
         
         if not tags:
             return
         
-        success_count = 0
-        for word in words:
-            word.tags.extend(tags)
-            word.tags = list(set(word.tags))  # 去重
-            word.calculate_completeness()
-            success_count += 1
+        with self.core.deferred_save():
+            success_count = self.core.batch_apply([word.id for word in words], tags_add=tags)
         
-        self.core._data_changed = True
         self.console.print(f"✅ 已为 {success_count} 个单词添加标签: {', '.join(tags)}", style="green")
     
     def batch_change_status(self, words: List[Word]):
         """批量修改状态"""
-        status_options = [
-            ("1", "草稿", WordStatus.DRAFT),
-            ("2", "学习中", WordStatus.LEARNING),
-            ("3", "复习中", WordStatus.REVIEWING),
-            ("4", "已掌握", WordStatus.MASTERED),
-        ]
-        
         self.console.print("选择新状态:")
-        for key, desc, _ in status_options:
+        for key, (desc, _) in enumerate(_STATUS_OPTIONS, 1):
             self.console.print(f"  {key}. {desc}")
         
-        choice = Prompt.ask("选择状态", choices=[s[0] for s in status_options], 
-                           default=self.core.config.ui_defaults.batch_status_default)
-        new_status = status_options[int(choice) - 1][2]
+        choice = self._ask_index("选择状态", len(_STATUS_OPTIONS),
+                                 self.core.config.ui_defaults.batch_status_default)
+        new_status = _STATUS_OPTIONS[choice - 1][1]
         
-        success_count = 0
-        for word in words:
-            word.status = new_status
-            word.calculate_completeness()
-            success_count += 1
+        changed = [word for word in words if word.status is not new_status]
+        if not changed:
+            self.console.print("⚠️ 所有选中单词已是该状态", style="dim")
+            return
+        
+        with self.core.deferred_save():
+            success_count = self.core.batch_apply([word.id for word in changed], status=new_status)
         
-        self.core._data_changed = True
         self.console.print(f"✅ 已将 {success_count} 个单词状态修改为: {new_status.value}", style="green")
     
     def batch_add_notes(self, words: List[Word]):
@@ -507,39 +590,34 @@ class RichCliUI:
             return
         
         tags_input = Prompt.ask("笔记标签 (可选)", default="")
-        tags = [t.strip() for t in tags_input.split(',') if t.strip()]
+        tags = _parse_tags(tags_input)
         
-        success_count = 0
-        for word in words:
-            self.core.add_note_quick(word.id, note_content, tags, "批量编辑")
-            success_count += 1
+        with self.core.deferred_save():
+            success_count = self.core.add_note_batch([word.id for word in words],
+                                                     note_content, tags, "批量编辑")
         
         self.console.print(f"✅ 已为 {success_count} 个单词添加笔记", style="green")
     
     def batch_change_difficulty(self, words: List[Word]):
         """批量修改难度"""
-        difficulty_options = [
-            ("1", "简单", 1),
-            ("2", "中等", 2),
-            ("3", "困难", 3),
-            ("4", "非常困难", 4),
-        ]
-        
         self.console.print("选择难度等级:")
-        for key, desc, _ in difficulty_options:
+        for key, (desc, _) in enumerate(_DIFFICULTY_OPTIONS, 1):
             self.console.print(f"  {key}. {desc}")
         
-        choice = Prompt.ask("选择难度", choices=[d[0] for d in difficulty_options], 
-                           default=self.core.config.ui_defaults.batch_difficulty_default)
-        new_difficulty = difficulty_options[int(choice) - 1][2]
+        choice = self._ask_index("选择难度", len(_DIFFICULTY_OPTIONS),
+                                 self.core.config.ui_defaults.batch_difficulty_default)
+        new_difficulty = _DIFFICULTY_OPTIONS[choice - 1][1]
         
-        success_count = 0
-        for word in words:
-            word.learning_data.difficulty = new_difficulty
-            success_count += 1
+        changed = [word for word in words if word.learning_data.difficulty is not new_difficulty]
+        if not changed:
+            self.console.print("⚠️ 所有选中单词已是该难度", style="dim")
+            return
+        
+        with self.core.deferred_save():
+            success_count = self.core.batch_apply([word.id for word in changed],
+                                                  difficulty=new_difficulty)
         
-        self.core._data_changed = True
-        self.console.print(f"✅ 已将 {success_count} 个单词难度修改为: {new_difficulty}", style="green")
+        self.console.print(f"✅ 已将 {success_count} 个单词难度修改为: {new_difficulty.value}", style="green")
     
     def batch_delete_words(self, words: List[Word]):
         """批量删除单词"""
@@ -566,7 +644,8 @@ class RichCliUI:
         if Confirm.ask("确认删除这些单词? (此操作不可撤销)", 
                       default=self.core.config.ui_defaults.confirm_delete):
             word_ids = [w.id for w in selected_words]
-            success_count, fail_count = self.core.delete_words_batch(word_ids)
+            with self.core.deferred_save():
+                success_count, fail_count = self.core.delete_words_batch(word_ids)
             
             if success_count > 0:
                 self.console.print(f"✅ 成功删除 {success_count} 个单词", style="green")
@@ -585,15 +664,7 @@ class RichCliUI:
             if not query.strip():
                 continue
             
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=self.console
-            ) as progress:
-                task = progress.add_task("正在搜索...", total=None)
-                results = self.core.search_words(query)
-                time.sleep(0.3)
-                progress.update(task, completed=True)
+            results = self._cached_search(query)
             
             if not results:
                 self.console.print("😔 未找到相关单词", style="yellow")
@@ -604,16 +675,13 @@ class RichCliUI:
             
             # 详细查看选项
             if results:
-                try:
-                    choice = IntPrompt.ask(
-                        f"选择查看详情 (1-{len(results)}，0返回)",
-                        default=0
-                    )
-                    if 1 <= choice <= len(results):
-                        selected_word = results[choice - 1]
-                        self.show_word_detail_menu(selected_word)
-                except:
-                    continue
+                choice = IntPrompt.ask(
+                    f"选择查看详情 (1-{len(results)}，0返回)",
+                    default=0
+                )
+                if 1 <= choice <= len(results):
+                    selected_word = results[choice - 1]
+                    self.show_word_detail_menu(selected_word)
     
     def show_word_detail_menu(self, word: Word):
         """显示单词详情菜单"""
@@ -661,7 +729,7 @@ class RichCliUI:
             return
         
         tags_input = Prompt.ask("笔记标签 (可选)", default="")
-        tags = [t.strip() for t in tags_input.split(',') if t.strip()]
+        tags = _parse_tags(tags_input)
         
         note = self.core.add_note_to_word(word.id, content, tags)
         if note:
@@ -674,42 +742,21 @@ class RichCliUI:
         self.console.print(f"\n📝 复习笔记 - '[bold]{word.word}[/bold]'")
         
         # 显示快速笔记选项
-        quick_notes = [
-            ("1", "记忆技巧", "记忆这个单词的技巧"),
-            ("2", "易混词", "容易混淆的单词"),
-            ("3", "使用场景", "在什么情况下使用"),
-            ("4", "个人理解", "自己的理解和感悟"),
-            ("5", "自定义", "输入自定义内容"),
-        ]
-        
         self.console.print("选择笔记类型:")
-        for key, desc, _ in quick_notes:
+        for key, (desc, _, _) in enumerate(_QUICK_NOTE_OPTIONS, 1):
             self.console.print(f"  {key}. {desc}")
         
-        choice = Prompt.ask("选择类型", choices=[n[0] for n in quick_notes], 
-                           default=self.core.config.ui_defaults.note_type_default)
+        choice = self._ask_index("选择类型", len(_QUICK_NOTE_OPTIONS),
+                                 self.core.config.ui_defaults.note_type_default)
         
-        if choice == "1":
-            content = Prompt.ask("记忆技巧")
-            tags = ["memory", "tip"]
-            context = "记忆技巧"
-        elif choice == "2":
-            content = Prompt.ask("易混词")
-            tags = ["confusion", "similar"]
-            context = "易混词"
-        elif choice == "3":
-            content = Prompt.ask("使用场景")
-            tags = ["usage", "context"]
-            context = "使用场景"
-        elif choice == "4":
-            content = Prompt.ask("个人理解")
-            tags = ["understanding", "personal"]
-            context = "个人理解"
-        else:  # 自定义
+        desc, tags, context = _QUICK_NOTE_OPTIONS[choice - 1]
+        if tags is None:  # 自定义
             content = Prompt.ask("笔记内容")
             tags_input = Prompt.ask("标签 (可选)", default="")
-            tags = [t.strip() for t in tags_input.split(',') if t.strip()]
-            context = "复习笔记"
+            tags = _parse_tags(tags_input)
+        else:
+            content = Prompt.ask(desc)
+            tags = list(tags)
         
         if content.strip():
             note = self.core.add_note_during_review(word.id, content, context)
@@ -751,12 +798,13 @@ class RichCliUI:
         if not words:
             return
         
+        total = len(words)
         reviewed = 0
         correct = 0
         
         for i, word in enumerate(words, 1):
             self.console.print(f"\n{'='*50}")
-            self.console.print(f"复习进度: {i}/{len(words)}")
+            self.console.print(f"复习进度: {i}/{total}")
             self.console.print(f"{'='*50}")
             
             # 根据模式选择复习方式
@@ -790,13 +838,13 @@ class RichCliUI:
                 self.add_note_during_review(word)
             
             # 询问是否继续
-            if i < len(words):
+            if i < total:
                 if not Confirm.ask("继续下一个?", 
                                  default=self.core.config.ui_defaults.confirm_continue_review):
                     break
         
         # 显示复习总结
-        self.show_review_summary(reviewed, correct, len(words))
+        self.show_review_summary(reviewed, correct, total)
     
     def _review_word_to_definition(self, word: Word) -> str:
         """单词→释义复习模式"""
@@ -807,7 +855,7 @@ class RichCliUI:
             self.console.print(f"🔊 发音: {word.core_info.pronunciation}")
         
         # 让用户思考
-        input("\n💭 请回忆这个单词的含义，按回车查看答案...")
+        self.console.input("\n💭 请回忆这个单词的含义，按回车查看答案...")
         
         # 显示答案
         self.console.print(f"\n📖 释义: [green]{word.core_info.primary_definition}[/green]")
@@ -817,7 +865,7 @@ class RichCliUI:
         
         if word.notes:
             self.console.print("📝 笔记:")
-            for note in word.notes[:2]:  # 显示前2个笔记
+            for note in islice(word.notes, 2):  # 显示前2个笔记
                 self.console.print(f"   💬 {note.get_simplified_display()}")
         
         # 评估掌握程度
@@ -841,15 +889,11 @@ class RichCliUI:
         
         # 获取用户选择
         while True:
-            try:
-                choice = IntPrompt.ask("选择答案", default=1)
-                if 1 <= choice <= len(options):
-                    selected_word = options[choice - 1]
-                    break
-                else:
-                    self.console.print("❌ 请输入有效的选项编号", style="red")
-            except:
-                self.console.print("❌ 请输入有效的数字", style="red")
+            choice = IntPrompt.ask("选择答案", default=1)
+            if 1 <= choice <= len(options):
+                selected_word = options[choice - 1]
+                break
+            self.console.print("❌ 请输入有效的选项编号", style="red")
         
         # 显示结果
         if selected_word.id == word.id:
@@ -927,8 +971,8 @@ class RichCliUI:
                 # 处理范围格式，如 "1-10"
                 try:
                     start, end = part.split('-', 1)
-                    start_idx = int(start.strip()) - 1  # 转换为0基索引
-                    end_idx = int(end.strip()) - 1
+                    start_idx = int(start) - 1  # 转换为0基索引，int()本身忽略首尾空白
+                    end_idx = int(end) - 1
                     
                     # 确保范围有效
                     start_idx = max(0, start_idx)
@@ -1058,14 +1102,12 @@ class RichCliUI:
             # 笔记
             if word.notes:
                 self.console.print("\n💬 笔记:")
-                for note in word.notes[:3]:  # 最多显示3个笔记
+                for note in islice(word.notes, 3):  # 最多显示3个笔记
                     self.console.print(f"   📝 {note.get_simplified_display(40)}")
             
             # 学习数据
-            status_icon = self.status_icons.get(word.status, "?")
-            status_color = self.status_colors.get(word.status, "white")
             learning_info = (
-                f"📊 状态: [{status_color}]{status_icon} {word.status.value}[/{status_color}] | "
+                f"📊 状态: {_STATUS_LABELS[word.status]} | "
                 f"完整度: {word.completeness:.1%} | "
                 f"复习: {word.learning_data.review_count}次"
             )
@@ -1079,7 +1121,8 @@ class RichCliUI:
         if Confirm.ask("确认删除这些单词? (此操作不可撤销)", 
                       default=self.core.config.ui_defaults.confirm_delete):
             word_ids = [w.id for w in words]
-            success_count, fail_count = self.core.delete_words_batch(word_ids)
+            with self.core.deferred_save():
+                success_count, fail_count = self.core.delete_words_batch(word_ids)
             
             if success_count > 0:
                 self.console.print(f"✅ 成功删除 {success_count} 个单词", style="green")
@@ -1094,10 +1137,9 @@ class RichCliUI:
         summary.add_column("项目", style="cyan")
         summary.add_column("数量", style="bold")
         
-        summary.add_row("计划复习", str(total))
-        summary.add_row("实际复习", str(reviewed))
-        summary.add_row("掌握良好", str(correct))
-        summary.add_row("正确率", f"{accuracy:.1f}%")
+        values = (str(total), str(reviewed), str(correct), f"{accuracy:.1f}%")
+        for label, value in zip(_SUMMARY_ROWS, values):
+            summary.add_row(label, value)
         
         self.console.print()
         self.console.print(summary)
@@ -1131,8 +1173,9 @@ class RichCliUI:
         basic_table.add_row("笔记总数", str(stats['notes_count']))
         
         if stats['last_added']:
-            last_added = datetime.fromisoformat(stats['last_added'])
-            basic_table.add_row("最近添加", last_added.strftime("%Y-%m-%d %H:%M"))
+            # last_added取自learning_data.added_date，默认为datetime.isoformat()生成的字符串，
+            # 直接截取到分钟；若为非ISO格式的值，这里不会报错而是原样截断显示
+            basic_table.add_row("最近添加", stats['last_added'][:16].replace('T', ' '))
         
         # 状态分布表格
         status_table = Table(title="📈 状态分布", box=box.ROUNDED)
@@ -1141,41 +1184,42 @@ class RichCliUI:
         status_table.add_column("占比", style="dim")
         
         total = stats['total_words']
-        for status, count in stats['by_status'].items():
-            percentage = (count / total * 100) if total > 0 else 0
-            icon = self.status_icons.get(WordStatus(status), "?")
+        percent_per_word = 100.0 / total if total > 0 else 0.0
+        by_status = stats['by_status']
+        for status in WordStatus:
+            count = by_status[status.value]
             status_table.add_row(
-                f"{icon} {status}",
+                f"{_STATUS_ICONS[status]} {status.value}",
                 str(count),
-                f"{percentage:.1f}%"
+                f"{count * percent_per_word:.1f}%"
             )
         
         # 显示表格
         self.console.print()
         self.console.print(Columns([basic_table, status_table]))
         
-        # 学习建议
-        self.show_learning_suggestions(stats)
+        # 学习建议（复用上面已取出的状态计数）
+        self.show_learning_suggestions(
+            stats, by_status[WordStatus.DRAFT.value], by_status[WordStatus.MASTERED.value]
+        )
 
         while True:
             if Confirm.ask("返回主菜单", default=True):
                 break
     
-    def show_learning_suggestions(self, stats: Dict[str, Any]):
+    def show_learning_suggestions(self, stats: Dict[str, Any], draft_count: int, mastered_count: int):
         """显示学习建议"""
         suggestions = []
         
         if stats['words_for_review'] > 0:
             suggestions.append(f"🔔 您有 {stats['words_for_review']} 个单词需要复习")
         
-        draft_count = stats['by_status'].get('draft', 0)
         if draft_count > 0:
             suggestions.append(f"📝 有 {draft_count} 个单词信息不完整，建议补充")
         
         if stats['avg_completeness'] < 0.6:
             suggestions.append("📈 平均完整度较低，建议完善单词信息")
         
-        mastered_count = stats['by_status'].get('mastered', 0)
         total = stats['total_words']
         if total > 0:
             mastery_rate = mastered_count / total
@@ -1205,25 +1249,24 @@ class RichCliUI:
         if show_notes:
             table.add_column("笔记", width=20)
         
+        add_row = table.add_row
+        markup = _STATUS_MARKUP
+        
         for i, word in enumerate(words, 1):
-            icon = self.status_icons.get(word.status, "?")
-            status_color = self.status_colors.get(word.status, "white")
-            
-            row_data = [
+            definition = word.core_info.primary_definition
+            row_data = (
                 str(i),
                 word.word,
-                f"[{status_color}]{icon}[/{status_color}]",
-                word.core_info.primary_definition[:50] + "..." if len(word.core_info.primary_definition) > 50 else word.core_info.primary_definition,
+                markup[word.status],
+                f"{definition[:50]}..." if len(definition) > 50 else definition,
                 f"{word.completeness:.0%}"
-            ]
+            )
             
             if show_notes:
-                notes_preview = ""
-                if word.notes:
-                    notes_preview = word.notes[0].get_simplified_display(30)
-                row_data.append(notes_preview)
+                notes = word.notes
+                row_data += (notes[0].get_simplified_display(30) if notes else "",)
             
-            table.add_row(*row_data)
+            add_row(*row_data)
         
         self.console.print(table)
     
@@ -1232,37 +1275,37 @@ class RichCliUI:
         if not words:
             return
         
+        # 拼接后一次输出，避免逐行调用console.print的渲染开销
+        lines = []
         for word in words:
-            icon = self.status_icons.get(word.status, "?")
-            color = self.status_colors.get(word.status, "white")
-            self.console.print(
-                f"  {icon} [{color}]{word.word}[/{color}] - {word.core_info.primary_definition}"
-            )
+            icon = _STATUS_ICONS[word.status]
+            color = _STATUS_COLORS[word.status]
+            lines.append(f"  {icon} [{color}]{word.word}[/{color}] - {word.core_info.primary_definition}")
+        self.console.print("\n".join(lines))
     
     def display_word_detail(self, word: Word):
         """显示单词详细信息"""
-        # 创建主要信息面板
-        content_parts = []
+        core_info = word.core_info
+        extended_info = word.extended_info
         
-        # 基本信息
-        content_parts.append(f"🔤 [bold blue]{word.word}[/bold blue]")
+        # 创建主要信息面板：基本信息
+        content_parts = [f"🔤 [bold blue]{word.word}[/bold blue]"]
         
-        if word.core_info.pronunciation:
-            content_parts.append(f"🔊 {word.core_info.pronunciation}")
+        if core_info.pronunciation:
+            content_parts.append(f"🔊 {core_info.pronunciation}")
         
-        if word.core_info.part_of_speech:
-            content_parts.append(f"📝 {word.core_info.part_of_speech}")
+        if core_info.part_of_speech:
+            content_parts.append(f"📝 {core_info.part_of_speech}")
         
-        content_parts.append(f"📖 {word.core_info.primary_definition}")
+        content_parts.append(f"📖 {core_info.primary_definition}")
         
-        # 扩展信息
-        if word.extended_info.examples:
-            content_parts.append("\n📚 例句:")
-            for example in word.extended_info.examples[:3]:
-                content_parts.append(f"   • {example}")
+        # 扩展信息（每节合成一段文本）
+        if extended_info.examples:
+            examples_text = "\n".join(f"   • {example}" for example in extended_info.examples[:3])
+            content_parts.append(f"\n📚 例句:\n{examples_text}")
         
-        if word.extended_info.synonyms:
-            content_parts.append(f"\n🔗 同义词: {', '.join(word.extended_info.synonyms)}")
+        if extended_info.synonyms:
+            content_parts.append(f"\n🔗 同义词: {', '.join(extended_info.synonyms)}")
         
         # 标签
         if word.tags:
@@ -1271,48 +1314,47 @@ class RichCliUI:
         
         # 笔记
         if word.notes:
-            content_parts.append("\n💬 笔记:")
-            for note in word.notes:
-                content_parts.append(f"   📝 {note.get_full_display()}")
+            notes_text = "\n".join(f"   📝 {note.get_full_display()}" for note in word.notes)
+            content_parts.append(f"\n💬 笔记:\n{notes_text}")
         
         # 学习数据
-        status_icon = self.status_icons.get(word.status, "?")
-        status_color = self.status_colors.get(word.status, "white")
-        
-        learning_info = (
-            f"📊 状态: [{status_color}]{status_icon} {word.status.value}[/{status_color}] | "
+        status = word.status
+        content_parts.append(
+            f"\n📊 状态: {_STATUS_LABELS[status]} | "
             f"完整度: {word.completeness:.1%} | "
             f"复习: {word.learning_data.review_count}次"
         )
-        content_parts.append(f"\n{learning_info}")
         
         # 显示面板
-        panel_content = "\n".join(content_parts)
         self.console.print(Panel(
-            panel_content,
+            "\n".join(content_parts),
             title=f"📖 {word.word}",
-            border_style=self.status_colors.get(word.status, "white")
+            border_style=_STATUS_COLORS[status]
         ))
     
     def edit_word_info(self, word: Word):
         """编辑单词信息"""
         self.console.print(f"✏️ 编辑 '[bold]{word.word}[/bold]' (留空保持原值)")
         
-        # 编辑核心信息
-        new_def = Prompt.ask("主要释义", default=word.core_info.primary_definition)
-        if new_def != word.core_info.primary_definition:
-            word.core_info.primary_definition = new_def
+        core_info = word.core_info
+        changes = {}
         
-        new_pronunciation = Prompt.ask("发音", default=word.core_info.pronunciation)
-        if new_pronunciation != word.core_info.pronunciation:
-            word.core_info.pronunciation = new_pronunciation
-        
-        new_pos = Prompt.ask("词性", default=word.core_info.part_of_speech)
-        if new_pos != word.core_info.part_of_speech:
-            word.core_info.part_of_speech = new_pos
+        # 编辑核心信息
+        for field_name, label in (("primary_definition", "主要释义"),
+                                  ("pronunciation", "发音"),
+                                  ("part_of_speech", "词性")):
+            current = getattr(core_info, field_name)
+            new_value = Prompt.ask(label, default=current)
+            if new_value != current:
+                changes[field_name] = new_value
+        
+        # 全部保持原值时无需更新，也不必重算完整度
+        if not changes:
+            self.console.print("📝 未做任何修改", style="dim")
+            return
         
-        # 更新完整度
-        word.calculate_completeness()
+        # 通过核心更新，同时刷新完整度和缓存
+        self.core.update_word(word.id, **changes)
         self.console.print("✅ 更新成功", style="green")
     
     def manage_word_tags(self, word: Word):
@@ -1328,14 +1370,13 @@ class RichCliUI:
         
         if action == "add":
             new_tags = Prompt.ask("添加标签 (逗号分隔)")
-            tags_to_add = [t.strip() for t in new_tags.split(',') if t.strip()]
-            word.tags.extend(tags_to_add)
-            word.tags = list(set(word.tags))  # 去重
+            tags_to_add = _parse_tags(new_tags)
+            self.core.update_word(word.id, tags=list(dict.fromkeys(word.tags + tags_to_add)))  # 去重并保持顺序
             self.console.print("✅ 标签已添加", style="green")
         
         elif action == "replace":
             new_tags = Prompt.ask("新标签 (逗号分隔)")
-            word.tags = [t.strip() for t in new_tags.split(',') if t.strip()]
+            self.core.update_word(word.id, tags=list(dict.fromkeys(_parse_tags(new_tags))))  # 去重并保持顺序
             self.console.print("✅ 标签已替换", style="green")
     
     def show_word_learning_history(self, word: Word):
@@ -1415,7 +1456,6 @@ class RichCliUI:
         ) as progress:
             task = progress.add_task("正在保存数据...", total=None)
             success = self.core.save_data(force=True)
-            time.sleep(0.5)
             progress.update(task, completed=True)
         
         if success:
@@ -1432,7 +1472,6 @@ class RichCliUI:
         ) as progress:
             task = progress.add_task("正在创建备份...", total=None)
             success = self.core.storage.backup()
-            time.sleep(0.8)
             progress.update(task, completed=True)
         
         if success:
@@ -1450,9 +1489,15 @@ class RichCliUI:
         file_info.add_column("信息", style="bold")
         
         data_file = self.core.config.data_file
-        if os.path.exists(data_file):
-            file_size = os.path.getsize(data_file) / 1024  # KB
-            mod_time = datetime.fromtimestamp(os.path.getmtime(data_file))
+        # 一次stat同时取得存在性、大小和修改时间
+        try:
+            file_stat = os.stat(data_file)
+        except FileNotFoundError:
+            file_stat = None
+        
+        if file_stat is not None:
+            file_size = file_stat.st_size / 1024  # KB
+            mod_time = datetime.fromtimestamp(file_stat.st_mtime)
             
             file_info.add_row("数据文件", data_file)
             file_info.add_row("文件大小", f"{file_size:.1f} KB")
@@ -1492,98 +1537,82 @@ class RichCliUI:
         elif choice == "5":
             return
     
-    def show_basic_settings(self):
-        """显示基本设置"""
-        config = self.core.config
-        
-        settings_table = Table(title="基本设置", box=box.ROUNDED)
+    def _show_settings(self, title: str, rows: tuple, edit):
+        """显示设置表格并询问是否修改，rows为(设置项, 当前值, 说明)元组，edit为对应的编辑方法"""
+        settings_table = Table(title=title, box=box.ROUNDED)
         settings_table.add_column("设置项", style="cyan")
         settings_table.add_column("当前值", style="bold")
         settings_table.add_column("说明", style="dim")
         
-        settings_table.add_row("自动保存", str(config.auto_save), "是否自动保存数据")
-        settings_table.add_row("保存间隔", f"{config.auto_save_interval}秒", "自动保存间隔")
-        settings_table.add_row("备份功能", str(config.backup_enabled), "是否启用备份")
-        settings_table.add_row("备份数量", str(config.backup_count), "保留的备份文件数")
-        settings_table.add_row("掌握阈值", f"{config.mastery_threshold:.1%}", "判断掌握的正确率")
+        for row in rows:
+            settings_table.add_row(*row)
         
         self.console.print(settings_table)
         
-        if Confirm.ask("修改基本设置?", default=False):
-            self.edit_basic_settings()
+        if Confirm.ask(f"修改{title}?", default=False):
+            edit()
+    
+    def show_basic_settings(self):
+        """显示基本设置"""
+        config = self.core.config
+        
+        self._show_settings("基本设置", (
+            ("自动保存", str(config.auto_save), "是否自动保存数据"),
+            ("保存间隔", f"{config.auto_save_interval}秒", "自动保存间隔"),
+            ("备份功能", str(config.backup_enabled), "是否启用备份"),
+            ("备份数量", str(config.backup_count), "保留的备份文件数"),
+            ("掌握阈值", f"{config.mastery_threshold:.1%}", "判断掌握的正确率"),
+        ), self.edit_basic_settings)
     
     def show_add_word_settings(self):
         """显示添加单词设置"""
         config = self.core.config.add_word_config
         
-        settings_table = Table(title="添加单词设置", box=box.ROUNDED)
-        settings_table.add_column("设置项", style="cyan")
-        settings_table.add_column("当前值", style="bold")
-        settings_table.add_column("说明", style="dim")
-        
-        settings_table.add_row("跳过发音", str(config.skip_pronunciation), "添加单词时跳过发音输入")
-        settings_table.add_row("跳过词性", str(config.skip_part_of_speech), "添加单词时跳过词性输入")
-        settings_table.add_row("跳过语境", str(config.skip_context), "添加单词时跳过语境输入")
-        settings_table.add_row("跳过标签", str(config.skip_tags), "添加单词时跳过标签输入")
-        settings_table.add_row("自动提升状态", str(config.auto_promote_to_learning), "有定义时自动提升为learning状态")
-        settings_table.add_row("默认标签", ", ".join(config.default_tags) or "无", "添加单词时的默认标签")
-        
-        self.console.print(settings_table)
-        
-        if Confirm.ask("修改添加单词设置?", default=False):
-            self.edit_add_word_settings()
+        self._show_settings("添加单词设置", (
+            ("跳过发音", str(config.skip_pronunciation), "添加单词时跳过发音输入"),
+            ("跳过词性", str(config.skip_part_of_speech), "添加单词时跳过词性输入"),
+            ("跳过语境", str(config.skip_context), "添加单词时跳过语境输入"),
+            ("跳过标签", str(config.skip_tags), "添加单词时跳过标签输入"),
+            ("自动提升状态", str(config.auto_promote_to_learning), "有定义时自动提升为learning状态"),
+            ("默认标签", ", ".join(config.default_tags) or "无", "添加单词时的默认标签"),
+        ), self.edit_add_word_settings)
     
     def show_ui_defaults_settings(self):
         """显示UI默认值设置"""
         config = self.core.config.ui_defaults
         
-        settings_table = Table(title="UI默认值设置", box=box.ROUNDED)
-        settings_table.add_column("设置项", style="cyan")
-        settings_table.add_column("当前值", style="bold")
-        settings_table.add_column("说明", style="dim")
-        
-        settings_table.add_row("主菜单默认", config.main_menu_default, "主菜单的默认选择")
-        settings_table.add_row("复习表现默认", config.review_performance_default, "复习时的默认表现评级")
-        settings_table.add_row("词汇表排序默认", config.vocabulary_sort_default, "词汇表管理的默认排序")
-        settings_table.add_row("批量编辑默认", config.batch_edit_default, "批量编辑的默认操作")
-        settings_table.add_row("笔记类型默认", config.note_type_default, "笔记类型的默认选择")
-        settings_table.add_row("继续复习确认", str(config.confirm_continue_review), "复习时继续的默认确认")
-        settings_table.add_row("添加笔记确认", str(config.confirm_add_note), "添加笔记的默认确认")
-        settings_table.add_row("批量编辑确认", str(config.confirm_batch_edit), "批量编辑的默认确认")
-        settings_table.add_row("删除确认", str(config.confirm_delete), "删除操作的默认确认")
-        
-        self.console.print(settings_table)
-        
-        if Confirm.ask("修改UI默认值设置?", default=False):
-            self.edit_ui_defaults_settings()
+        self._show_settings("UI默认值设置", (
+            ("主菜单默认", config.main_menu_default, "主菜单的默认选择"),
+            ("复习表现默认", config.review_performance_default, "复习时的默认表现评级"),
+            ("词汇表排序默认", config.vocabulary_sort_default, "词汇表管理的默认排序"),
+            ("批量编辑默认", config.batch_edit_default, "批量编辑的默认操作"),
+            ("笔记类型默认", config.note_type_default, "笔记类型的默认选择"),
+            ("继续复习确认", str(config.confirm_continue_review), "复习时继续的默认确认"),
+            ("添加笔记确认", str(config.confirm_add_note), "添加笔记的默认确认"),
+            ("批量编辑确认", str(config.confirm_batch_edit), "批量编辑的默认确认"),
+            ("删除确认", str(config.confirm_delete), "删除操作的默认确认"),
+        ), self.edit_ui_defaults_settings)
     
     def show_learning_settings(self):
         """显示学习算法设置"""
         config = self.core.config
         
-        settings_table = Table(title="学习算法设置", box=box.ROUNDED)
-        settings_table.add_column("设置项", style="cyan")
-        settings_table.add_column("当前值", style="bold")
-        settings_table.add_column("说明", style="dim")
-        
-        settings_table.add_row("掌握阈值", f"{config.mastery_threshold:.1%}", "判断掌握的正确率")
-        settings_table.add_row("掌握复习次数", str(config.mastery_review_count), "达到掌握需要的复习次数")
-        settings_table.add_row("最大间隔天数", str(config.max_interval_days), "复习间隔的最大天数")
-        settings_table.add_row("优秀间隔", f"{config.sr_base_intervals['excellent']}天", "优秀表现的复习间隔")
-        settings_table.add_row("良好间隔", f"{config.sr_base_intervals['good']}天", "良好表现的复习间隔")
-        settings_table.add_row("一般间隔", f"{config.sr_base_intervals['fair']}天", "一般表现的复习间隔")
-        settings_table.add_row("较差间隔", f"{config.sr_base_intervals['poor']}天", "较差表现的复习间隔")
-        
-        self.console.print(settings_table)
-        
-        if Confirm.ask("修改学习算法设置?", default=False):
-            self.edit_learning_settings()
+        self._show_settings("学习算法设置", (
+            ("掌握阈值", f"{config.mastery_threshold:.1%}", "判断掌握的正确率"),
+            ("掌握复习次数", str(config.mastery_review_count), "达到掌握需要的复习次数"),
+            ("最大间隔天数", str(config.max_interval_days), "复习间隔的最大天数"),
+            ("优秀间隔", f"{config.sr_base_intervals['excellent']}天", "优秀表现的复习间隔"),
+            ("良好间隔", f"{config.sr_base_intervals['good']}天", "良好表现的复习间隔"),
+            ("一般间隔", f"{config.sr_base_intervals['fair']}天", "一般表现的复习间隔"),
+            ("较差间隔", f"{config.sr_base_intervals['poor']}天", "较差表现的复习间隔"),
+        ), self.edit_learning_settings)
     
     def edit_basic_settings(self):
         """编辑基本设置"""
         config = self.core.config
         
         # 自动保存设置
+        auto_save_was_enabled = config.auto_save
         config.auto_save = Confirm.ask("启用自动保存?", default=config.auto_save)
         
         if config.auto_save:
@@ -1617,8 +1646,8 @@ class RichCliUI:
         config.save()
         self.console.print("✅ 基本设置已保存", style="green")
         
-        # 重启自动保存
-        if config.auto_save:
+        # 仅在自动保存由关闭变为开启时启动后台线程；间隔的修改由运行中的线程在下一轮生效
+        if config.auto_save and not auto_save_was_enabled:
             self.core._start_auto_save()
     
     def edit_add_word_settings(self):
@@ -1636,19 +1665,83 @@ class RichCliUI:
         # 默认标签
         current_tags = ", ".join(config.default_tags) if config.default_tags else ""
         new_tags = Prompt.ask("默认标签 (逗号分隔)", default=current_tags)
-        if new_tags.strip():
-            config.default_tags = [t.strip() for t in new_tags.split(',') if t.strip()]
-        else:
-            config.default_tags = []
+        config.default_tags = _parse_tags(new_tags)
         
         # 保存配置
         self.core.config.save()
         self.console.print("✅ 添加单词设置已保存", style="green")
     
+    def _edit_in_editor(self, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """在 $VISUAL/$EDITOR 中以JSON一次性编辑多项设置
+
+        未设置编辑器、用户选择不使用编辑器、编辑器运行失败、内容无法解析或未做修改时
+        返回None，由调用方逐项询问
+        """
+        editor = os.environ.get("VISUAL") or os.environ.get("EDITOR")
+        if not editor or not Confirm.ask(f"在编辑器 ({escape(editor)}) 中一次性修改?", default=False):
+            return None
+        
+        fd, path = tempfile.mkstemp(suffix=".json", text=True)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            if os.name == "nt" and os.path.isfile(editor):
+                # 未加引号、含空格的编辑器路径整体作为程序
+                command = [editor]
+            elif os.name == "nt":
+                # Windows路径含反斜杠，不能按POSIX规则拆分；非POSIX模式会保留引号，需去掉
+                command = [part.strip('"') for part in shlex.split(editor, posix=False)]
+            else:
+                command = shlex.split(editor)
+            subprocess.run(command + [path], check=True)
+            with open(path, encoding="utf-8") as f:
+                edited = json.load(f)
+        except (OSError, ValueError, subprocess.CalledProcessError) as e:
+            self.console.print(f"⚠️ 编辑器修改未生效: {escape(str(e))}，改为逐项设置", style="yellow")
+            return None
+        finally:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        
+        if not isinstance(edited, dict):
+            self.console.print("⚠️ 编辑内容应为JSON对象，改为逐项设置", style="yellow")
+            return None
+        if edited == data:
+            # 图形界面编辑器未等待关闭就返回时（如 code 需加 -w），文件内容不会变化
+            self.console.print("⚠️ 编辑器中未做修改（编辑器需等待关闭后才返回），改为逐项设置", style="yellow")
+            return None
+        return edited
+    
+    def _warn_invalid_settings(self, invalid: List[str]):
+        """提示编辑器中未通过校验、保持原值的设置项"""
+        if invalid:
+            self.console.print(f"⚠️ 以下设置无效，已保持原值: {', '.join(invalid)}", style="yellow")
+    
     def edit_ui_defaults_settings(self):
         """编辑UI默认值设置"""
         config = self.core.config.ui_defaults
         
+        # 有编辑器时一次性编辑全部字段，否则逐项询问
+        current = {name: getattr(config, name) for name in (*_UI_DEFAULT_CHOICES, *_UI_DEFAULT_FLAGS)}
+        edited = self._edit_in_editor(current)
+        if edited is not None:
+            invalid = []
+            for name, value in edited.items():
+                if name in _UI_DEFAULT_CHOICES:
+                    valid = isinstance(value, str) and len(value) == 1 and value in _UI_DEFAULT_CHOICES[name]
+                else:
+                    valid = name in _UI_DEFAULT_FLAGS and isinstance(value, bool)
+                if valid:
+                    setattr(config, name, value)
+                else:
+                    invalid.append(name)
+            self._warn_invalid_settings(invalid)
+            self.core.config.save()
+            self.console.print("✅ UI默认值设置已保存", style="green")
+            return
+        
         # 主菜单默认
         config.main_menu_default = Prompt.ask("主菜单默认选择 (1-9)", 
                                              default=config.main_menu_default)
@@ -1695,6 +1788,38 @@ class RichCliUI:
         """编辑学习算法设置"""
         config = self.core.config
         
+        # 有编辑器时一次性编辑全部字段，否则逐项询问
+        intervals = config.sr_base_intervals
+        edited = self._edit_in_editor({
+            "mastery_threshold_percent": int(config.mastery_threshold * 100),
+            "mastery_review_count": config.mastery_review_count,
+            "max_interval_days": config.max_interval_days,
+            "sr_base_intervals": {key: intervals[key] for key in ("excellent", "good", "fair", "poor")},
+        })
+        if edited is not None:
+            def positive_int(value) -> bool:
+                return type(value) is int and value > 0
+            
+            invalid = []
+            for name, value in edited.items():
+                if name == "sr_base_intervals" and isinstance(value, dict):
+                    for key, days in value.items():
+                        # 间隔天数允许小数，如较差表现默认0.5天
+                        if key in intervals and type(days) in (int, float) and days > 0:
+                            intervals[key] = days
+                        else:
+                            invalid.append(f"sr_base_intervals.{key}")
+                elif name == "mastery_threshold_percent" and positive_int(value):
+                    config.mastery_threshold = max(50, min(100, value)) / 100
+                elif name in ("mastery_review_count", "max_interval_days") and positive_int(value):
+                    setattr(config, name, value)
+                else:
+                    invalid.append(name)
+            self._warn_invalid_settings(invalid)
+            config.save()
+            self.console.print("✅ 学习算法设置已保存", style="green")
+            return
+        
         # 掌握阈值
         mastery_percent = int(config.mastery_threshold * 100)
         new_mastery = IntPrompt.ask(
@@ -1750,35 +1875,35 @@ class RichCliUI:
         self.console.clear()
         self.display_header()
         
+        # 菜单项到处理方法的映射与提示函数只绑定一次，循环内直接查表分派
+        ask = Prompt.ask
+        ui_defaults = self.core.config.ui_defaults
+        actions = {
+            "1": self.quick_add_word,
+            "2": self.batch_input_session,
+            "3": self.start_review,
+            "4": self.search_words,
+            "5": self.show_learning_statistics,
+            "6": self.data_management,
+            "7": self.vocabulary_management,
+            "8": self.manage_settings,
+        }
+        choices = [*actions, "9"]
+        
         try:
             while True:
                 self.display_main_menu()
                 
-                choice = Prompt.ask(
+                choice = ask(
                     "\n🎯 请选择功能",
-                    choices=["1", "2", "3", "4", "5", "6", "7", "8", "9"],
-                    default=self.core.config.ui_defaults.main_menu_default
+                    choices=choices,
+                    default=ui_defaults.main_menu_default
                 )
+                if choice == "9":
+                    break
                 
                 try:
-                    if choice == "1":
-                        self.quick_add_word()
-                    elif choice == "2":
-                        self.batch_input_session()
-                    elif choice == "3":
-                        self.start_review()
-                    elif choice == "4":
-                        self.search_words()
-                    elif choice == "5":
-                        self.show_learning_statistics()
-                    elif choice == "6":
-                        self.data_management()
-                    elif choice == "7":
-                        self.vocabulary_management()
-                    elif choice == "8":
-                        self.manage_settings()
-                    elif choice == "9":
-                        break
+                    actions[choice]()
                 
                 except KeyboardInterrupt:
                     self.console.print("\n⏸️  操作中断", style="yellow")
@@ -1807,11 +1932,9 @@ class RichCliUI:
             
             # 保存数据
             self.core.save_data(force=True)
-            time.sleep(0.5)
             
             # 清理核心资源
             self.core.cleanup()
-            time.sleep(0.3)
             
             progress.update(task, completed=True)
         